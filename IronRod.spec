@@ -49,6 +49,13 @@ try:
 except ImportError:
     pass
 
+# NumPy: vectorised carver hot paths (pure-Python fallbacks if missing)
+try:
+    import numpy
+    hidden_imports.append('numpy')
+except ImportError:
+    pass
+
 # Optional: pyewf
 try:
     import pyewf
@@ -69,7 +76,7 @@ a = Analysis(
     hooksconfig={},
     runtime_hooks=[],
     excludes=[
-        'matplotlib', 'numpy', 'scipy', 'pandas',  # Not needed
+        'matplotlib', 'scipy', 'pandas',  # Not needed
         'test', 'unittest', 'pytest',
     ],
     noarchive=False,
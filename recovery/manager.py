@@ -10,13 +10,17 @@ import struct
 import hashlib
 import logging
 import threading
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from typing import Optional, Callable
 
 from .scanner import DiskScanner, RecoveredFile, ScanProgress, DriveInfo
 from .signatures import get_all_categories, HEADER_SIGNATURES
 from .smart_filter import validate_carved_file
-from .tsk_scanner import save_tsk_file, TSKDeletedFile, is_available as tsk_is_available
+from .tsk_scanner import (
+    save_tsk_file, drain_validations, close_tsk_cache, TSKDeletedFile,
+    is_available as tsk_is_available,
+)
 from .damage_detector import analyze_damage, DamageReport
 from .file_repair import (
     repair_file, verify_saved_file, verify_data_integrity,
@@ -371,9 +375,13 @@ class RecoveryManager:
 
             try:
                 import io as _io
-                img = PILImage.open(_io.BytesIO(data))
+                buf = _io.BytesIO(data)
+                img = PILImage.open(buf)
                 img.verify()
-                img = PILImage.open(_io.BytesIO(data))
+                # verify() invalidates the image — rewind the same buffer
+                # and re-open instead of wrapping the data a second time
+                buf.seek(0)
+                img = PILImage.open(buf)
                 img.load()
 
                 w, h = img.size
@@ -636,8 +644,30 @@ class RecoveryManager:
         """
         saved = []
         total = len(files)
+        reported = 0
         logger.info("Saving %d files to %s", total, output_dir)
 
+        # TSK saves run their decode check in the background; their
+        # progress is reported once the check has a verdict
+        pending: list[tuple[str, Future]] = []
+        awaiting: dict[str, RecoveredFile] = {}
+
+        def report(rf: RecoveredFile, ok: bool):
+            nonlocal reported
+            reported += 1
+            if on_progress:
+                on_progress(reported, total, saved_ok=ok,
+                            file_size=rf.size if ok else 0, file_ext=rf.extension)
+
+        def settle(wait: bool):
+            for path, ok in drain_validations(pending, wait):
+                rf = awaiting.pop(path)
+                if not ok:
+                    # Already removed from disk
+                    rf.recovered_path = ""
+                    rf.is_saved = False
+                report(rf, ok)
+
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
 
@@ -645,9 +675,7 @@ class RecoveryManager:
             try:
                 if rf.is_saved and rf.recovered_path and os.path.exists(rf.recovered_path):
                     saved.append(rf)
-                    if on_progress:
-                        on_progress(i + 1, total, saved_ok=True,
-                                    file_size=rf.size, file_ext=rf.extension)
+                    report(rf, True)
                     continue
 
                 subdir = os.path.join(output_dir, rf.category)
@@ -666,18 +694,15 @@ class RecoveryManager:
                 # Re-read from raw device
                 if not rf.raw_device_path:
                     logger.warning("File %d has no raw_device_path — cannot re-carve", i)
-                    if on_progress:
-                        on_progress(i + 1, total, saved_ok=False,
-                                    file_size=0, file_ext=rf.extension)
+                    report(rf, False)
                     continue
                 if rf.size <= 0:
                     logger.warning("File %d has invalid size %d — skipping", i, rf.size)
-                    if on_progress:
-                        on_progress(i + 1, total, saved_ok=False,
-                                    file_size=0, file_ext=rf.extension)
+                    report(rf, False)
                     continue
 
                 # TSK files: use pytsk3 to read data blocks (handles fragmentation)
+                deferred = False
                 if rf.source == "tsk" and rf.tsk_inode > 0 and tsk_is_available():
                     tsk_file = TSKDeletedFile(
                         name=rf.original_name or rf.display_name,
@@ -689,7 +714,9 @@ class RecoveryManager:
                         offset=rf.offset,
                         raw_device=rf.raw_device_path,
                     )
-                    ok = save_tsk_file(rf.raw_device_path, tsk_file, out_path)
+                    ok = save_tsk_file(rf.raw_device_path, tsk_file, out_path,
+                                       pending=pending)
+                    deferred = ok
                 else:
                     ok = self._re_carve_and_save(
                         rf.raw_device_path, rf.offset, rf.size,
@@ -699,21 +726,26 @@ class RecoveryManager:
                     rf.recovered_path = out_path
                     rf.is_saved = True
                     saved.append(rf)
-                    if on_progress:
-                        on_progress(i + 1, total, saved_ok=True,
-                                    file_size=rf.size, file_ext=rf.extension)
+                    if deferred:
+                        awaiting[out_path] = rf
+                    else:
+                        report(rf, True)
                 else:
                     logger.warning("Re-carve failed for file %d (offset=%d, size=%d, device=%s)",
                                    i, rf.offset, rf.size, rf.raw_device_path)
-                    if on_progress:
-                        on_progress(i + 1, total, saved_ok=False,
-                                    file_size=0, file_ext=rf.extension)
+                    report(rf, False)
 
             except Exception as e:
                 logger.warning("Save failed for file %d: %s", i, e, exc_info=True)
-                if on_progress:
-                    on_progress(i + 1, total, saved_ok=False,
-                                file_size=0, file_ext=rf.extension)
+                report(rf, False)
+
+            settle(wait=False)
+
+        # Release the device handles save_tsk_file kept open for this batch
+        close_tsk_cache()
+
+        settle(wait=True)
+        saved = [rf for rf in saved if rf.is_saved]
 
         logger.info("Save complete: %d/%d files saved", len(saved), total)
         return saved
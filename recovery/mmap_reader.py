@@ -7,6 +7,7 @@ PROFESSIONAL APPROACH
 2. Sector-aligned reads (512-byte boundaries) — required for raw devices.
 3. Empty block skipping — skip all-zero chunks (TRIM'd / never-written).
 4. Fallback to plain read() if mmap fails (works on all platforms).
+5. Sequential access hint (madvise / posix_fadvise) — larger kernel readahead.
 
 Performance impact:
   • mmap:          2–5x faster than read() on large sequential scans.
@@ -19,45 +20,55 @@ import mmap
 import logging
 from typing import Optional, BinaryIO
 
+# ── NumPy for vectorised zero scans (optional) ────────────────
+try:
+    import numpy as _np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
 logger = logging.getLogger(__name__)
 
 # Sector size (standard for all modern drives)
 SECTOR_SIZE = 512
 
-# Precomputed zero block for fast comparison
-_ZERO_4MB = b"\x00" * (4 * 1024 * 1024)
-_ZERO_1MB = b"\x00" * (1 * 1024 * 1024)
+# Precomputed zero block for fast comparison.  Fixed size: longer blocks
+# (block + overlap) are compared against it one slice at a time
+_ZERO_BUF_SIZE = 4 * 1024 * 1024
+_zero_buf = b"\x00" * _ZERO_BUF_SIZE
+
+# Below this, a plain memcmp beats the NumPy call overhead
+_NUMPY_MIN_BLOCK = 64 * 1024
+
+
+# Sector sizes are powers of two, so alignment is a single bitmask
+assert SECTOR_SIZE & (SECTOR_SIZE - 1) == 0
 
 
 def align_down(offset: int, alignment: int = SECTOR_SIZE) -> int:
-    """Round offset DOWN to the nearest sector boundary."""
-    return (offset // alignment) * alignment
+    """Round offset DOWN to the nearest sector boundary (power-of-two alignment)."""
+    return offset & ~(alignment - 1)
 
 
 def align_up(offset: int, alignment: int = SECTOR_SIZE) -> int:
-    """Round offset UP to the nearest sector boundary."""
-    return ((offset + alignment - 1) // alignment) * alignment
+    """Round offset UP to the nearest sector boundary (power-of-two alignment)."""
+    return (offset + alignment - 1) & ~(alignment - 1)
 
 
 def is_empty_block(data: bytes) -> bool:
     """
     Fast check if a data block is entirely zeros.
 
-    Uses memoryview comparison for speed — avoids Python-level iteration.
-    A zero block means TRIM'd / never-written / wiped — cannot contain
-    recoverable data.
+    Uses a vectorised NumPy reduction when available, else a single
+    memcmp against a cached zero buffer — no Python-level iteration and
+    no per-call allocation. A zero block means TRIM'd / never-written /
+    wiped — cannot contain recoverable data.
     """
     length = len(data)
     if length == 0:
         return True
 
-    # Fast path: compare against precomputed zero block
-    if length == len(_ZERO_4MB):
-        return data == _ZERO_4MB
-    if length == len(_ZERO_1MB):
-        return data == _ZERO_1MB
-
-    # General case: check first/last bytes first (fast reject)
+    # Check first/last bytes first (fast reject)
     if data[0] != 0 or data[-1] != 0:
         return False
 
@@ -68,7 +79,16 @@ def is_empty_block(data: bytes) -> bool:
             return False
 
     # Full comparison (only reached if samples are all zero)
-    return data == b"\x00" * length
+    if _HAS_NUMPY and length >= _NUMPY_MIN_BLOCK:
+        words = length // 8
+        if _np.frombuffer(data, dtype=_np.uint64, count=words).any():
+            return False
+        return not any(data[words * 8:])
+    if length <= _ZERO_BUF_SIZE:
+        return _zero_buf.startswith(data)
+    view = memoryview(data)
+    return all(_zero_buf.startswith(view[i:i + _ZERO_BUF_SIZE])
+               for i in range(0, length, _ZERO_BUF_SIZE))
 
 
 def is_low_entropy_block(data: bytes, threshold: int = 4) -> bool:
@@ -117,6 +137,8 @@ class DiskReader:
 
         if use_mmap and total_size > 0:
             self._try_mmap()
+        if total_size > 0:
+            self._advise_sequential()
 
     def _try_mmap(self):
         """Attempt to memory-map the file/device."""
@@ -143,6 +165,23 @@ class DiskReader:
             self._mmap = None
             self._using_mmap = False
 
+    def _advise_sequential(self):
+        """Tell the kernel the device will be read front to back.
+
+        Widens readahead for the scan; purely advisory, so unsupported
+        platforms (Windows; posix_fadvise on macOS) and devices that
+        reject it are silently ignored.
+        """
+        try:
+            if self._mmap is not None and hasattr(mmap, "MADV_SEQUENTIAL"):
+                self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+            elif hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(
+                    self._fd.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL,
+                )
+        except (OSError, ValueError, AttributeError) as e:
+            logger.debug("Sequential access hint not applied: %s", e)
+
     @property
     def is_mmap(self) -> bool:
         return self._using_mmap
@@ -212,6 +251,23 @@ class DiskReader:
             if read_size <= 0:
                 break
 
+            # Skip empty blocks — checked on a zero-copy view of the
+            # mapping, so skipped blocks are never copied out of it
+            if skip_empty and read_size >= SECTOR_SIZE and self._using_mmap:
+                view = memoryview(self._mmap)[offset:offset + read_size]
+                try:
+                    view_len = len(view)
+                    empty = view_len >= SECTOR_SIZE and is_empty_block(view)
+                finally:
+                    view.release()
+                if empty:
+                    skipped_bytes += view_len
+                    offset += view_len  # No overlap needed for empty blocks
+                    continue
+                skip_check = False
+            else:
+                skip_check = skip_empty
+
             chunk = self.read_at(offset, read_size)
             if not chunk:
                 break
@@ -219,7 +275,7 @@ class DiskReader:
             actual_len = len(chunk)
 
             # Skip empty blocks
-            if skip_empty and actual_len >= SECTOR_SIZE:
+            if skip_check and actual_len >= SECTOR_SIZE:
                 if is_empty_block(chunk):
                     skipped_bytes += actual_len
                     offset += actual_len  # No overlap needed for empty blocks
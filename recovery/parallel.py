@@ -34,6 +34,8 @@ from .signatures import (
     SIG_WEBM,
     SIG_TS,
     is_mpeg_ts,
+    find_all,
+    find_all_headers,
 )
 from .smart_filter import (
     validate_carved_file,
@@ -306,19 +308,6 @@ _AMBIGUOUS_HEADERS = {
 }
 
 
-def _find_all(data: bytes, pattern: bytes) -> list[int]:
-    """Return all positions of pattern in data."""
-    positions = []
-    start = 0
-    while True:
-        pos = data.find(pattern, start)
-        if pos == -1:
-            break
-        positions.append(pos)
-        start = pos + 1
-    return positions
-
-
 def _search_chunk_worker_full(
     fd, reader, chunk, offset, chunk_len, disk_size,
     want: dict, output_dir,
@@ -334,11 +323,12 @@ def _search_chunk_worker_full(
     found = []
 
     # ── Fixed-header signatures (all types) ──
+    header_hits = find_all_headers(chunk)
     for header_bytes, sig in header_sigs:
         if not want.get(sig.category, True):
             continue
 
-        for hit in _find_all(chunk, header_bytes):
+        for hit in header_hits.get(header_bytes, ()):
             abs_off = offset + hit
             if dedup.is_duplicate_offset(abs_off):
                 continue
@@ -353,7 +343,7 @@ def _search_chunk_worker_full(
                 found.append(rec)
 
     # ── RIFF-based formats (WebP, AVI, WAV) ──
-    for hit in _find_all(chunk, b"RIFF"):
+    for hit in find_all(chunk, b"RIFF"):
         if hit + 12 > chunk_len:
             continue
         sub_type = bytes(chunk[hit + 8:hit + 12])
@@ -377,7 +367,7 @@ def _search_chunk_worker_full(
 
     # ── MPEG-TS detection ──
     if want.get("Video", True):
-        for hit in _find_all(chunk, b"\x47"):
+        for hit in find_all(chunk, b"\x47"):
             abs_off = offset + hit
             if abs_off % 188 != 0 and abs_off % 512 != 0:
                 continue
@@ -394,7 +384,7 @@ def _search_chunk_worker_full(
                     found.append(rec)
 
     # ── ISO Base Media (ftyp → MP4/MOV/HEIC/M4A/3GP) ──
-    for hit in _find_all(chunk, b"ftyp"):
+    for hit in find_all(chunk, b"ftyp"):
         box_start = hit - 4
         if box_start < 0:
             continue
@@ -431,7 +421,7 @@ def _search_chunk_worker_full(
     # ── FORM-based AIFF ──
     if want.get("Audio", True):
         from .signatures import SIG_AIFF
-        for hit in _find_all(chunk, b"FORM"):
+        for hit in find_all(chunk, b"FORM"):
             if hit + 12 > chunk_len:
                 continue
             sub_type = bytes(chunk[hit + 8:hit + 12])
@@ -454,7 +444,7 @@ def _search_chunk_worker_full(
             SIG_ZIP, SIG_DOCX, SIG_XLSX, SIG_PPTX,
             SIG_EPUB, SIG_ODT, SIG_ODS, SIG_ODP,
         )
-        for hit in _find_all(chunk, b"PK\x03\x04"):
+        for hit in find_all(chunk, b"PK\x03\x04"):
             abs_off = offset + hit
             if dedup.is_duplicate_offset(abs_off):
                 continue
@@ -502,7 +492,7 @@ def _search_chunk_worker_full(
     # ── TAR detection (ustar at offset 257) ──
     if want.get("Archive", True):
         from .signatures import SIG_TAR
-        for hit in _find_all(chunk, b"ustar"):
+        for hit in find_all(chunk, b"ustar"):
             tar_start = hit - 257
             if tar_start < 0:
                 continue
@@ -523,7 +513,7 @@ def _search_chunk_worker_full(
     # ── ISO 9660 detection (CD001 at offset 32769) ──
     if want.get("Archive", True):
         from .signatures import SIG_ISO
-        for hit in _find_all(chunk, b"CD001"):
+        for hit in find_all(chunk, b"CD001"):
             iso_start = hit - 32769
             if iso_start < 0:
                 continue
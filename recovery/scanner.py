@@ -20,7 +20,7 @@ HOW FILE CARVING WORKS
 1.  Open the raw block device in read-only binary mode.
 2.  Read large chunks (4 MB) into memory.
 3.  Within each chunk, search for EVERY occurrence of known magic bytes
-    using Python's fast bytes.find().
+    in a single pass (signatures.find_all_headers).
 4.  For JPEG and PNG: search for the end-of-file footer marker.
 5.  For ISO Base Media (MP4, MOV, HEIC): detect by "ftyp" at offset +4,
     then walk the box/atom structure to compute total file size.
@@ -52,6 +52,8 @@ from .signatures import (
     SIG_MKV,
     SIG_WEBM,
     SIG_TS,
+    find_all,
+    find_all_headers,
 )
 from .smart_filter import (
     validate_carved_file,
@@ -1546,11 +1548,12 @@ class DiskScanner:
         }
 
         # ── Fixed-header signatures ──
+        header_hits = find_all_headers(chunk)
         for header_bytes, sig in self._header_sigs:
             if not _want.get(sig.category, True):
                 continue
 
-            for hit in self._find_all(chunk, header_bytes):
+            for hit in header_hits.get(header_bytes, ()):
                 abs_off = offset + hit
                 if self._dedup.is_duplicate_offset(abs_off):
                     continue
@@ -1565,7 +1568,7 @@ class DiskScanner:
                     self._log_recovery(file_counter + len(found), rf)
 
         # ── RIFF-based formats (WebP, AVI) ──
-        for hit in self._find_all(chunk, b"RIFF"):
+        for hit in find_all(chunk, b"RIFF"):
             if hit + 12 > chunk_len:
                 continue
             sub_type = bytes(chunk[hit + 8:hit + 12])
@@ -1596,7 +1599,7 @@ class DiskScanner:
 
         # ── MPEG-TS detection (0x47 sync byte every 188 bytes) ──
         if want_video:
-            for hit in self._find_all(chunk, b"\x47"):
+            for hit in find_all(chunk, b"\x47"):
                 # Only check at sector-aligned offsets to reduce false positives
                 abs_off = offset + hit
                 if abs_off % 188 != 0 and abs_off % 512 != 0:
@@ -1616,7 +1619,7 @@ class DiskScanner:
                             self._log_recovery(file_counter + len(found), rf)
 
         # ── ISO Base Media (ftyp → MP4/MOV/HEIC/3GP/M4V/AVIF) ──
-        for hit in self._find_all(chunk, b"ftyp"):
+        for hit in find_all(chunk, b"ftyp"):
             box_start = hit - 4
             if box_start < 0:
                 continue
@@ -1662,7 +1665,7 @@ class DiskScanner:
                 SIG_ZIP, SIG_DOCX, SIG_XLSX, SIG_PPTX,
                 SIG_EPUB, SIG_ODT, SIG_ODS, SIG_ODP,
             )
-            for hit in self._find_all(chunk, b"PK\x03\x04"):
+            for hit in find_all(chunk, b"PK\x03\x04"):
                 abs_off = offset + hit
                 if self._dedup.is_duplicate_offset(abs_off):
                     continue
@@ -1720,7 +1723,7 @@ class DiskScanner:
 
         # ── FORM-based AIFF detection ──
         if want_audio:
-            for hit in self._find_all(chunk, b"FORM"):
+            for hit in find_all(chunk, b"FORM"):
                 if hit + 12 > chunk_len:
                     continue
                 sub_type = bytes(chunk[hit + 8:hit + 12])
@@ -1743,7 +1746,7 @@ class DiskScanner:
         # ── TAR detection (ustar magic at offset 257 within a 512-byte block) ──
         if want_archive:
             from .signatures import SIG_TAR
-            for hit in self._find_all(chunk, b"ustar"):
+            for hit in find_all(chunk, b"ustar"):
                 # ustar should be at offset 257 within a 512-byte TAR header
                 # So the TAR header starts at (hit - 257)
                 tar_start = hit - 257
@@ -1767,7 +1770,7 @@ class DiskScanner:
         # ── ISO 9660 detection (CD001 at offset 32769 = 0x8001) ──
         if want_archive:
             from .signatures import SIG_ISO
-            for hit in self._find_all(chunk, b"CD001"):
+            for hit in find_all(chunk, b"CD001"):
                 # CD001 appears at offset 32769 (sector 16 * 2048 + 1)
                 iso_start = hit - 32769
                 if iso_start < 0:
@@ -1845,21 +1848,6 @@ class DiskScanner:
             pass
         return default_sig
 
-    # ─── Find all occurrences of a pattern in a chunk ────────
-
-    @staticmethod
-    def _find_all(data: bytes, pattern: bytes) -> list[int]:
-        """Return all positions of `pattern` in `data`."""
-        positions = []
-        start = 0
-        while True:
-            pos = data.find(pattern, start)
-            if pos == -1:
-                break
-            positions.append(pos)
-            start = pos + 1
-        return positions
-
     # ─── Carve JPEG / PNG (header → footer) ──────────────────
 
     def _carve_footer_file(
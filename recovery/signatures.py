@@ -16,11 +16,19 @@ Exported for the scanner:
   • RIFF_TYPES         — dict mapping RIFF sub-type → SignatureInfo
   • FTYP_BRANDS        — dict mapping ftyp brand → SignatureInfo
   • SignatureInfo       — lightweight dataclass describing a file type
+  • find_all_headers() — every HEADER_SIGNATURES hit in a chunk, in one pass
 """
 
 from dataclasses import dataclass
 from typing import Optional
 
+# ── NumPy for the single-pass header search (optional) ───────
+try:
+    import numpy as _np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
 
 @dataclass(frozen=True)
 class SignatureInfo:
@@ -967,6 +975,95 @@ def is_mpeg_ts(data: bytes, offset: int = 0) -> bool:
     return True
 
 
+# ═════════════════════════════════════════════════════════════
+#  Multi-pattern header search
+# ═════════════════════════════════════════════════════════════
+# One bytes.find() pass per header costs ~75 passes over every chunk.
+# Instead, every adjacent byte pair of the chunk is looked up (vectorised)
+# in a 64K table of "key" pairs; only the few positions that hit are
+# checked against the headers using that key.
+#
+# A header's key is its most selective byte pair, at a fixed offset inside
+# the header — not simply its first two bytes: six headers (JP2, ICO,
+# MPEG PS/ES) start with 00 00, and zero runs are everywhere on a real disk
+# (slack, padding, TRIM'd sectors), which would turn every zero pair into
+# a Python-level candidate. A header with no selective pair at all is left
+# to a plain bytes.find() loop.
+
+_COMMON_BYTES = (0x00, 0xFF)
+
+
+def _pair_commonness(header: bytes, k: int) -> int:
+    """How many of header[k:k+2] are fill bytes (0x00 / 0xFF)."""
+    return (header[k] in _COMMON_BYTES) + (header[k + 1] in _COMMON_BYTES)
+
+
+_HEADER_KEYS: dict[int, list[tuple[bytes, int]]] = {}   # pair → [(header, offset)]
+_HEADER_UNKEYED: list[bytes] = []                       # searched with find()
+for _header in dict.fromkeys(h for h, _ in HEADER_SIGNATURES):
+    _k = min(range(len(_header) - 1), key=lambda k: _pair_commonness(_header, k))
+    if _pair_commonness(_header, _k) == 2:
+        _HEADER_UNKEYED.append(_header)
+    else:
+        _key = (_header[_k] << 8) | _header[_k + 1]
+        _HEADER_KEYS.setdefault(_key, []).append((_header, _k))
+
+if _HAS_NUMPY:
+    _HEADER_KEY_TABLE = _np.zeros(1 << 16, dtype=bool)
+    _HEADER_KEY_TABLE[list(_HEADER_KEYS)] = True
+
+
+def find_all(data: bytes, pattern: bytes) -> list[int]:
+    """Return all positions of `pattern` in `data`, overlaps included."""
+    positions = []
+    start = 0
+    while True:
+        pos = data.find(pattern, start)
+        if pos == -1:
+            break
+        positions.append(pos)
+        start = pos + 1
+    return positions
+
+
+def find_all_headers(data: bytes) -> dict[bytes, list[int]]:
+    """
+    Find every occurrence of every HEADER_SIGNATURES header in `data`.
+
+    Returns {header_bytes: [positions, ascending]} for headers that occur —
+    the same positions a bytes.find() loop per header would give,
+    overlaps included. Falls back to exactly that without NumPy.
+    """
+    hits: dict[bytes, list[int]] = {}
+    if not _HAS_NUMPY or len(data) < 2:
+        keyed = [h for group in _HEADER_KEYS.values() for h, _ in group]
+        for header in keyed + _HEADER_UNKEYED:
+            positions = find_all(data, header)
+            if positions:
+                hits[header] = positions
+        return hits
+
+    arr = _np.frombuffer(data, dtype=_np.uint8)
+    pairs = arr[:-1].astype(_np.uint16)
+    pairs <<= 8
+    pairs |= arr[1:]
+    candidates = _np.flatnonzero(_HEADER_KEY_TABLE[pairs])
+
+    # Candidates ascend and each header has one fixed key offset, so each
+    # header's positions come out ascending
+    for pos in candidates.tolist():
+        for header, k in _HEADER_KEYS[(data[pos] << 8) | data[pos + 1]]:
+            start = pos - k
+            if start >= 0 and data.startswith(header, start):
+                hits.setdefault(header, []).append(start)
+
+    for header in _HEADER_UNKEYED:
+        positions = find_all(data, header)
+        if positions:
+            hits[header] = positions
+    return hits
+
+
 # ═════════════════════════════════════════════════════════════
 #  Convenience helpers
 # ═════════════════════════════════════════════════════════════
@@ -21,29 +21,58 @@ from __future__ import annotations
 import io
 import math
 import hashlib
+import importlib.util
 import struct
 import logging
-from typing import Optional
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
 # ── Pillow for deep image validation ─────────────────────────
+# Imported lazily on the first image candidate — scans that never see an
+# image extension don't pay for Pillow's import time or codec RSS.
+_PILImage = None
+_HAS_PILLOW = importlib.util.find_spec("PIL") is not None
+if not _HAS_PILLOW:
+    logger.info("Pillow not installed — deep image validation disabled")
+
+
+def _load_pillow():
+    """Import PIL.Image on first use.  Returns None if unavailable."""
+    global _PILImage, _HAS_PILLOW
+    if _PILImage is None and _HAS_PILLOW:
+        try:
+            from PIL import Image
+        except ImportError:
+            _HAS_PILLOW = False
+            logger.info("Pillow failed to import — deep image validation disabled")
+            return None
+        # Suppress DecompressionBombWarning for large recovered images.
+        # These are legitimate files, not attacks — data recovery regularly
+        # produces large uncompressed BMPs (100+ MP).
+        Image.MAX_IMAGE_PIXELS = None
+        _PILImage = Image
+    return _PILImage
+
+# ── NumPy for vectorised entropy (optional) ──────────────────
 try:
-    from PIL import Image as _PILImage
-    # Suppress DecompressionBombWarning for large recovered images.
-    # These are legitimate files, not attacks — data recovery regularly
-    # produces large uncompressed BMPs (100+ MP).
-    _PILImage.MAX_IMAGE_PIXELS = None
-    _HAS_PILLOW = True
+    import numpy as _np
+    _HAS_NUMPY = True
 except ImportError:
-    _HAS_PILLOW = False
-    logger.info("Pillow not installed — deep image validation disabled")
+    _HAS_NUMPY = False
 
 # ── Thresholds ────────────────────────────────────────────────
 MIN_FILE_SIZE = 4 * 1024        # 4 KB minimum
 MIN_FILE_SIZE_SMALL = 256       # for ICO and other small formats
 MIN_ENTROPY = 1.0               # was 2.0, too aggressive
 MAX_ENTROPY = 7.9999            # was 7.99, rejected valid JPEGs
+# Entropy is measured on a fixed window so the check is O(1) regardless of
+# file size.  MIN/MAX_ENTROPY above are calibrated on this window size.
+ENTROPY_SAMPLE_OFFSET = 1024    # skip past the header (clamped to len/4)
+ENTROPY_SAMPLE_SIZE = 4096
 
 
 def calculate_entropy(data: bytes) -> float:
@@ -51,14 +80,16 @@ def calculate_entropy(data: bytes) -> float:
     if not data:
         return 0.0
     length = len(data)
-    counts = [0] * 256
-    for b in data:
-        counts[b] += 1
+    if _HAS_NUMPY and length >= 256:
+        # Byte histogram + log in C — this runs on every carved candidate
+        counts = _np.bincount(_np.frombuffer(data, dtype=_np.uint8),
+                              minlength=256)
+        p = counts[counts > 0] / length
+        return 0.0 - float((p * _np.log2(p)).sum())
     entropy = 0.0
-    for c in counts:
-        if c > 0:
-            p = c / length
-            entropy -= p * math.log2(p)
+    for c in Counter(data).values():
+        p = c / length
+        entropy -= p * math.log2(p)
     return entropy
 
 
@@ -988,6 +1019,105 @@ _PILLOW_EXTS = {
     "webp", "ico", "psd", "jp2", "tga",
 }
 
+# Quick magic-byte table — leading bytes each extension must start with.
+# ``None`` means the format has no fixed leading magic and is handled by a
+# dedicated check in validate_file_data_matches_extension().
+# Built once at import; the compiler folds repeated literals into shared
+# constants, so each distinct magic (and tuple) exists exactly once.
+_EXT_MAGIC: dict[str, Optional[tuple[bytes, ...]]] = {
+    "jpg": (b"\xff\xd8\xff",),
+    "jpeg": (b"\xff\xd8\xff",),
+    "png": (b"\x89PNG",),
+    "gif": (b"GIF87a", b"GIF89a"),
+    "bmp": (b"BM",),
+    "tiff": (b"II\x2a\x00", b"MM\x00\x2a"),
+    "tif": (b"II\x2a\x00", b"MM\x00\x2a"),
+    "webp": (b"RIFF",),
+    "psd": (b"8BPS",),
+    "ico": (b"\x00\x00\x01\x00", b"\x00\x00\x02\x00"),
+    "mp4": None,  # check ftyp
+    "mov": None,
+    "avi": (b"RIFF",),
+    "mkv": (b"\x1a\x45\xdf\xa3",),
+    "webm": (b"\x1a\x45\xdf\xa3",),
+    "flv": (b"FLV",),
+    "wmv": (b"\x30\x26\xb2\x75",),
+    "mpg": None,   # any MPEG start code
+    "mpeg": None,  # any MPEG start code
+    "3gp": None,
+    "m4v": None,
+    "heic": None,
+    "avif": None,
+    "cr2": (b"II\x2a\x00",),
+    "nef": (b"MM\x00\x2a",),
+    "arw": (b"II\x2a\x00",),
+    "dng": (b"II\x2a\x00", b"MM\x00\x2a"),
+    "jp2": (b"\x00\x00\x00\x0c\x6a\x50",),
+    # Audio
+    "mp3": (b"ID3", b"\xff\xfb", b"\xff\xfa", b"\xff\xf3", b"\xff\xf2"),
+    "wav": (b"RIFF",),
+    "flac": (b"fLaC",),
+    "m4a": None,  # ftyp-based
+    "aiff": (b"FORM",),
+    "aif": (b"FORM",),
+    "mid": (b"MThd",),
+    "midi": (b"MThd",),
+    "wma": (b"\x30\x26\xb2\x75",),
+    "ogg": (b"OggS",),
+    # Documents
+    "pdf": (b"%PDF",),
+    "zip": (b"PK\x03\x04",),
+    "docx": (b"PK\x03\x04",),
+    "xlsx": (b"PK\x03\x04",),
+    "pptx": (b"PK\x03\x04",),
+    "sqlite": (b"SQLite format 3",),
+    # Documents (new)
+    "rtf": (b"{\\rtf",),
+    "xml": (b"<?xml", b"\xEF\xBB\xBF<?"),
+    "html": (b"<!DOCTYPE", b"<!doctype", b"<html", b"<HTML"),
+    "htm": (b"<!DOCTYPE", b"<!doctype", b"<html", b"<HTML"),
+    "eps": (b"%!PS-Adobe",),
+    "doc": (b"\xD0\xCF\x11\xE0",),
+    "xls": (b"\xD0\xCF\x11\xE0",),
+    "ppt": (b"\xD0\xCF\x11\xE0",),
+    "epub": (b"PK\x03\x04",),
+    "odt": (b"PK\x03\x04",),
+    "ods": (b"PK\x03\x04",),
+    "odp": (b"PK\x03\x04",),
+    # Archives
+    "7z": (b"7z\xBC\xAF\x27\x1C",),
+    "rar": (b"Rar!\x1A\x07",),
+    "gz": (b"\x1F\x8B",),
+    "bz2": (b"BZh",),
+    "xz": (b"\xFD\x37\x7A\x58\x5A\x00",),
+    "tar": None,  # TAR magic at offset 257
+    "cab": (b"MSCF",),
+    "zst": (b"\x28\xB5\x2F\xFD",),
+    "lz4": (b"\x04\x22\x4D\x18",),
+    # Executables
+    "exe": (b"MZ",),
+    "dll": (b"MZ",),
+    "elf": (b"\x7FELF",),
+    "dex": (b"dex\n",),
+    "wasm": (b"\x00asm",),
+    # Fonts
+    "ttf": (b"\x00\x01\x00\x00", b"true"),
+    "otf": (b"OTTO",),
+    "woff": (b"wOFF",),
+    "woff2": (b"wOF2",),
+    # Data/Science
+    "parquet": (b"PAR1",),
+    "hdf5": (b"\x89HDF\r\n",),
+    "h5": (b"\x89HDF\r\n",),
+    "npy": (b"\x93NUMPY",),
+    "pcap": (b"\xD4\xC3\xB2\xA1", b"\xA1\xB2\xC3\xD4"),
+    "pcapng": (b"\x0A\x0D\x0D\x0A",),
+    # System
+    "lnk": (b"\x4C\x00\x00\x00",),
+    "reg": (b"regf",),
+    "plist": (b"bplist",),
+}
+
 
 def validate_carved_file(extension: str, data: bytes) -> bool:
     """
@@ -1015,21 +1145,24 @@ def validate_carved_file(extension: str, data: bytes) -> bool:
         pass
     else:
         # Unknown extension — accept with entropy check only
-        logger.debug("No validator for .%s — using entropy check only", ext)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("No validator for .%s — using entropy check only", ext)
 
-    # Entropy check on a sample from the middle of the file
-    sample_start = min(1024, len(data) // 4)
-    sample_end = min(sample_start + 4096, len(data))
+    # Entropy check on a fixed-size sample just past the header
+    sample_start = min(ENTROPY_SAMPLE_OFFSET, len(data) // 4)
+    sample_end = min(sample_start + ENTROPY_SAMPLE_SIZE, len(data))
     sample = data[sample_start:sample_end]
     if len(sample) >= 256:
         entropy = calculate_entropy(sample)
         if entropy < MIN_ENTROPY:
-            logger.debug("Rejecting %s: entropy %.2f < %.2f",
-                         ext, entropy, MIN_ENTROPY)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Rejecting %s: entropy %.2f < %.2f",
+                             ext, entropy, MIN_ENTROPY)
             return False
         if entropy > MAX_ENTROPY:
-            logger.debug("Rejecting %s: entropy %.4f > %.4f",
-                         ext, entropy, MAX_ENTROPY)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Rejecting %s: entropy %.4f > %.4f",
+                             ext, entropy, MAX_ENTROPY)
             return False
 
     # ── Pillow deep validation for image files ────────────────
@@ -1044,23 +1177,149 @@ def validate_carved_file(extension: str, data: bytes) -> bool:
 
 def _pillow_validate(ext: str, data: bytes) -> bool:
     """Try to decode image data with Pillow.  Returns False if corrupt."""
+    # Cheap magic-byte reject before paying for Pillow's parser setup.
+    # Formats without a fixed leading magic (e.g. TGA) skip the precheck.
+    magics = _EXT_MAGIC.get(ext)
+    if magics and not data.startswith(magics):
+        return False
+    pil_image = _load_pillow()
+    if pil_image is None:
+        return True
     try:
-        img = _PILImage.open(io.BytesIO(data))
-        # .verify() checks structural integrity without full decode
-        # But some formats need .load() to catch truncation
-        img.verify()
-        # Re-open after verify (verify invalidates the image object)
-        img = _PILImage.open(io.BytesIO(data))
-        # Load a small portion to verify pixel data is readable
-        # For large BMPs (>10MB) just verify header via verify()
+        img = pil_image.open(io.BytesIO(data))
+        # .load() already catches structural and truncation errors, so a
+        # separate .verify() pass (and the re-open it forces) is redundant.
+        # For large BMPs (>10MB) just verify the structure without decoding.
         if len(data) < 10 * 1024 * 1024:
             img.load()
+        else:
+            img.verify()
         return True
     except Exception as e:
-        logger.debug("Pillow rejected %s (%d bytes): %s", ext, len(data), e)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Pillow rejected %s (%d bytes): %s", ext, len(data), e)
         return False
 
 
+def _has_ftyp(data: bytes) -> bool:
+    """ISO Base Media: 'ftyp' box at offset 4."""
+    return len(data) >= 8 and data[4:8] == b"ftyp"
+
+
+def _has_ustar(data: bytes) -> bool:
+    """TAR: 'ustar' at offset 257."""
+    return len(data) >= 262 and data[257:262] == b"ustar"
+
+
+def _has_cd001(data: bytes) -> bool:
+    """ISO 9660: 'CD001' at offset 32769."""
+    return len(data) >= 32774 and data[32769:32774] == b"CD001"
+
+
+def _magic_matcher(magics: tuple[bytes, ...]) -> Callable[[bytes], bool]:
+    return lambda data: data.startswith(magics)
+
+
+# Bounded window searched for ZIP member names — the local headers near
+# the start and the central directory near the end both list them.
+_ZIP_NAME_WINDOW = 64 * 1024
+
+
+def _zip_has_member(data: bytes, name: bytes) -> bool:
+    """Look for a ZIP member name in the head or tail window of *data*."""
+    if data.find(name, 0, _ZIP_NAME_WINDOW) != -1:
+        return True
+    tail = len(data) - _ZIP_NAME_WINDOW
+    return tail > 0 and data.find(name, tail) != -1
+
+
+def _zip_head_names(data: bytes):
+    """Yield member names from the local file headers at the start of a ZIP,
+    walking header to header until the head window, the data, or a header
+    with a deferred size (data descriptor) ends the chain."""
+    pos = 0
+    while pos + 30 <= min(len(data), _ZIP_NAME_WINDOW) and data.startswith(b"PK\x03\x04", pos):
+        flags, csize, nlen, xlen = struct.unpack_from("<H10xI4xHH", data, pos + 6)
+        yield data[pos + 30:pos + 30 + nlen]
+        if flags & 0x08:
+            return
+        pos += 30 + nlen + xlen + csize
+
+
+def _zip_directory_visible(data: bytes) -> bool:
+    """True if the end-of-central-directory record and the whole central
+    directory lie in the tail window, so every member name was searched."""
+    tail = max(0, len(data) - _ZIP_NAME_WINDOW)
+    eocd = data.rfind(b"PK\x05\x06", tail)
+    if eocd == -1 or eocd + 22 > len(data):
+        return False
+    cd_size, = struct.unpack_from("<I", data, eocd + 12)
+    return eocd - cd_size >= tail
+
+
+_OOXML_PART_DIRS = (b"word/", b"xl/", b"ppt/")
+
+
+def _ooxml_matcher(part_dir: bytes) -> Callable[[bytes], bool]:
+    """OOXML (docx/xlsx/pptx): a ZIP holding [Content_Types].xml and the
+    format's part directory (word/, xl/, ppt/).
+
+    The part directory is what tells docx, xlsx and pptx apart. If it is
+    seen, [Content_Types].xml is required too whenever the whole ZIP is
+    visible (end-of-central-directory record present) — callers often pass
+    only a 4 KB head sample, and producers that write [Content_Types].xml
+    last (LibreOffice) would otherwise be rejected.  If it is not seen, it
+    may just lie outside the head/tail windows (large media, big central
+    directory), so the data is only rejected when the leading members
+    belong to another OOXML kind or the whole central directory was read.
+    """
+    others = tuple(d for d in _OOXML_PART_DIRS if d != part_dir)
+
+    def match(data: bytes) -> bool:
+        if not data.startswith(b"PK\x03\x04"):
+            return False
+        if _zip_has_member(data, part_dir):
+            return (_zip_has_member(data, b"[Content_Types].xml")
+                    or not _zip_has_member(data, b"PK\x05\x06"))
+        if any(name.startswith(others) for name in _zip_head_names(data)):
+            return False
+        return not _zip_directory_visible(data)
+    return match
+
+
+def _mimetype_matcher(mimetype: bytes) -> Callable[[bytes], bool]:
+    """OpenDocument / EPUB: the spec requires an uncompressed 'mimetype'
+    member first in the ZIP, so its name and value sit right after the
+    30-byte local file header."""
+    marker = b"mimetype" + mimetype
+    return lambda data: (data.startswith(b"PK\x03\x04")
+                         and data.find(marker, 30, 30 + 64 + len(marker)) != -1)
+
+
+# Extension → data check, built once from _EXT_MAGIC plus the formats whose
+# signature isn't a leading magic.  Unlisted extensions are accepted.
+_EXT_MATCHERS: dict[str, Callable[[bytes], bool]] = {
+    ext: _magic_matcher(magics)
+    for ext, magics in _EXT_MAGIC.items() if magics
+}
+# MPEG: use the full validator (accepts many start codes)
+_EXT_MATCHERS.update(mpg=validate_mpg, mpeg=validate_mpg)
+_EXT_MATCHERS.update(dict.fromkeys(
+    ("mp4", "mov", "3gp", "m4v", "heic", "avif", "m4a"), _has_ftyp))
+_EXT_MATCHERS["tar"] = _has_ustar
+_EXT_MATCHERS["iso"] = _has_cd001
+# ZIP containers — a bare PK magic would accept any ZIP as any of these
+_EXT_MATCHERS.update(
+    docx=_ooxml_matcher(b"word/"),
+    xlsx=_ooxml_matcher(b"xl/"),
+    pptx=_ooxml_matcher(b"ppt/"),
+    epub=_mimetype_matcher(b"application/epub+zip"),
+    odt=_mimetype_matcher(b"application/vnd.oasis.opendocument.text"),
+    ods=_mimetype_matcher(b"application/vnd.oasis.opendocument.spreadsheet"),
+    odp=_mimetype_matcher(b"application/vnd.oasis.opendocument.presentation"),
+)
+
+
 def validate_file_data_matches_extension(ext: str, data: bytes) -> bool:
     """Check that the actual data format matches the claimed extension.
 
@@ -1069,157 +1328,66 @@ def validate_file_data_matches_extension(ext: str, data: bytes) -> bool:
     """
     if not data or len(data) < 4:
         return False
-    ext = ext.lower()
-    # Quick magic-byte check
-    _MAGIC = {
-        "jpg": (b"\xff\xd8\xff",),
-        "jpeg": (b"\xff\xd8\xff",),
-        "png": (b"\x89PNG",),
-        "gif": (b"GIF87a", b"GIF89a"),
-        "bmp": (b"BM",),
-        "tiff": (b"II\x2a\x00", b"MM\x00\x2a"),
-        "tif": (b"II\x2a\x00", b"MM\x00\x2a"),
-        "webp": (b"RIFF",),
-        "psd": (b"8BPS",),
-        "ico": (b"\x00\x00\x01\x00", b"\x00\x00\x02\x00"),
-        "mp4": None,  # check ftyp
-        "mov": None,
-        "avi": (b"RIFF",),
-        "mkv": (b"\x1a\x45\xdf\xa3",),
-        "webm": (b"\x1a\x45\xdf\xa3",),
-        "flv": (b"FLV",),
-        "wmv": (b"\x30\x26\xb2\x75",),
-        "mpg": None,   # handled below — any MPEG start code
-        "mpeg": None,  # handled below — any MPEG start code
-        "3gp": None,
-        "m4v": None,
-        "heic": None,
-        "avif": None,
-        "cr2": (b"II\x2a\x00",),
-        "nef": (b"MM\x00\x2a",),
-        "arw": (b"II\x2a\x00",),
-        "dng": (b"II\x2a\x00", b"MM\x00\x2a"),
-        "jp2": (b"\x00\x00\x00\x0c\x6a\x50",),
-        # Audio
-        "mp3": (b"ID3", b"\xff\xfb", b"\xff\xfa", b"\xff\xf3", b"\xff\xf2"),
-        "wav": (b"RIFF",),
-        "flac": (b"fLaC",),
-        "m4a": None,  # ftyp-based
-        "aiff": (b"FORM",),
-        "aif": (b"FORM",),
-        "mid": (b"MThd",),
-        "midi": (b"MThd",),
-        "wma": (b"\x30\x26\xb2\x75",),
-        "ogg": (b"OggS",),
-        # Documents
-        "pdf": (b"%PDF",),
-        "zip": (b"PK\x03\x04",),
-        "docx": (b"PK\x03\x04",),
-        "xlsx": (b"PK\x03\x04",),
-        "pptx": (b"PK\x03\x04",),
-        "sqlite": (b"SQLite format 3",),
-        # Documents (new)
-        "rtf": (b"{\\rtf",),
-        "xml": (b"<?xml", b"\xEF\xBB\xBF<?"),
-        "html": (b"<!DOCTYPE", b"<!doctype", b"<html", b"<HTML"),
-        "htm": (b"<!DOCTYPE", b"<!doctype", b"<html", b"<HTML"),
-        "eps": (b"%!PS-Adobe",),
-        "doc": (b"\xD0\xCF\x11\xE0",),
-        "xls": (b"\xD0\xCF\x11\xE0",),
-        "ppt": (b"\xD0\xCF\x11\xE0",),
-        "epub": (b"PK\x03\x04",),
-        "odt": (b"PK\x03\x04",),
-        "ods": (b"PK\x03\x04",),
-        "odp": (b"PK\x03\x04",),
-        # Archives
-        "7z": (b"7z\xBC\xAF\x27\x1C",),
-        "rar": (b"Rar!\x1A\x07",),
-        "gz": (b"\x1F\x8B",),
-        "bz2": (b"BZh",),
-        "xz": (b"\xFD\x37\x7A\x58\x5A\x00",),
-        "tar": None,  # TAR magic at offset 257
-        "cab": (b"MSCF",),
-        "zst": (b"\x28\xB5\x2F\xFD",),
-        "lz4": (b"\x04\x22\x4D\x18",),
-        # Executables
-        "exe": (b"MZ",),
-        "dll": (b"MZ",),
-        "elf": (b"\x7FELF",),
-        "dex": (b"dex\n",),
-        "wasm": (b"\x00asm",),
-        # Fonts
-        "ttf": (b"\x00\x01\x00\x00", b"true"),
-        "otf": (b"OTTO",),
-        "woff": (b"wOFF",),
-        "woff2": (b"wOF2",),
-        # Data/Science
-        "parquet": (b"PAR1",),
-        "hdf5": (b"\x89HDF\r\n",),
-        "h5": (b"\x89HDF\r\n",),
-        "npy": (b"\x93NUMPY",),
-        "pcap": (b"\xD4\xC3\xB2\xA1", b"\xA1\xB2\xC3\xD4"),
-        "pcapng": (b"\x0A\x0D\x0D\x0A",),
-        # System
-        "lnk": (b"\x4C\x00\x00\x00",),
-        "reg": (b"regf",),
-        "plist": (b"bplist",),
-    }
-    magics = _MAGIC.get(ext)
-    if magics is None:
-        # MPEG: use the full validator (accepts many start codes)
-        if ext in ("mpg", "mpeg"):
-            return validate_mpg(data)
-        # ISO Base Media: check for ftyp at offset 4
-        if ext in ("mp4", "mov", "3gp", "m4v", "heic", "avif", "m4a"):
-            return len(data) >= 8 and data[4:8] == b"ftyp"
-        # TAR: check for ustar at offset 257
-        if ext == "tar":
-            return len(data) >= 262 and data[257:262] == b"ustar"
-        # ISO: check for CD001 at offset 32769
-        if ext == "iso":
-            return len(data) >= 32774 and data[32769:32774] == b"CD001"
-        # Unknown extension — allow
-        return True
-    return any(data[:len(m)] == m for m in magics)
+    # Callers already pass lowercase extensions; islower() avoids
+    # allocating a copy in that common case.
+    matcher = _EXT_MATCHERS.get(ext if ext.islower() else ext.lower())
+    # Unknown extension — allow
+    return True if matcher is None else matcher(data)
 
 
 # ── Hashing ───────────────────────────────────────────────────
 
 def compute_md5(data: bytes) -> str:
-    return hashlib.md5(data).hexdigest()
+    # Content fingerprint, not a security primitive — lets OpenSSL skip its
+    # FIPS guards.  hashlib drops the GIL while hashing large buffers.
+    return hashlib.md5(data, usedforsecurity=False).hexdigest()
 
 
 def quick_hash(data: bytes, size: int = 8192) -> str:
     """Hash of head + tail for fast dedup."""
-    head = data[:size]
-    tail = data[-size:] if len(data) > size else b""
-    return hashlib.md5(head + tail).hexdigest()
+    return _quick_digest(data, size).hex()
+
+
+def _quick_digest(data: bytes, size: int = 8192) -> bytes:
+    """Raw 16-byte form of quick_hash() — compact enough to keep one per
+    recovered file in memory for the whole scan."""
+    h = hashlib.md5(data[:size], usedforsecurity=False)
+    if len(data) > size:
+        h.update(data[-size:])
+    return h.digest()
 
 
 class DeduplicationTracker:
     """Track already-recovered content to avoid duplicates."""
 
     def __init__(self):
-        self._quick_hashes: set[str] = set()
-        self._offsets: set[int] = set()
+        # Raw digests rather than hex strings: ~half the memory per entry
+        self._quick_hashes: set[bytes] = set()
+        # Sorted offsets packed as int64 — 8 bytes each, and the ±window
+        # check only needs the two neighbours found by binary search.
+        self._offsets = array("q")
 
     def is_duplicate_offset(self, offset: int, window: int = 512) -> bool:
         """Check if we already carved something within ±window of this offset."""
-        for o in self._offsets:
-            if abs(o - offset) < window:
-                return True
-        return False
+        offsets = self._offsets
+        i = bisect_left(offsets, offset)
+        if i < len(offsets) and offsets[i] - offset < window:
+            return True
+        return i > 0 and offset - offsets[i - 1] < window
 
     def is_duplicate_content(self, data: bytes) -> bool:
-        qh = quick_hash(data)
+        qh = _quick_digest(data)
         if qh in self._quick_hashes:
             return True
         self._quick_hashes.add(qh)
         return False
 
     def register(self, offset: int):
-        self._offsets.add(offset)
+        offsets = self._offsets
+        i = bisect_left(offsets, offset)
+        if i == len(offsets) or offsets[i] != offset:
+            offsets.insert(i, offset)
 
     def clear(self):
         self._quick_hashes.clear()
-        self._offsets.clear()
+        del self._offsets[:]
@@ -16,16 +16,35 @@ Supported platforms: macOS, Linux, Windows.
 
 import os
 import re
+import time
 import logging
 import platform
 import subprocess
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+_PLATFORM = platform.system()
 
-@dataclass
+# Output parsers are only needed by the detector for the running OS
+if _PLATFORM == "Darwin":
+    import plistlib
+elif _PLATFORM == "Windows":
+    import json
+
+# ── Precompiled patterns ─────────────────────────────────────
+# macOS disk identifiers / device nodes
+_RE_DISK_ID = re.compile(r"disk\d+")
+_RE_DEV_DISK = re.compile(r"r?disk\d+(?:s\d+)?")
+# system_profiler
+_RE_TRIM_SUPPORT = re.compile(r"TRIM Support:\s*(Yes|No)", re.IGNORECASE)
+
+
+@dataclass(slots=True)
 class DriveHealthInfo:
     """Pre-scan drive analysis results."""
     device_path: str
@@ -68,6 +87,12 @@ class DriveHealthInfo:
         return self.is_ssd and self.trim_enabled and not self.is_external
 
 
+# Drive topology is stable for a session, and each detection spawns several
+# slow subprocesses — cache results per device path for a few minutes.
+_HEALTH_TTL = 300.0
+_HEALTH_CACHE: dict[str, tuple[DriveHealthInfo, float]] = {}
+
+
 def detect_drive_health(device_or_mount: str) -> DriveHealthInfo:
     """
     Analyze a drive for SSD/TRIM status before scanning.
@@ -76,24 +101,25 @@ def detect_drive_health(device_or_mount: str) -> DriveHealthInfo:
         device_or_mount: Raw device path (/dev/rdisk2s1) or mount point (/Volumes/USB).
 
     Returns:
-        DriveHealthInfo with recovery feasibility assessment.
+        DriveHealthInfo with recovery feasibility assessment.  Results are
+        cached per path for ``_HEALTH_TTL`` seconds; callers get a copy.
     """
+    cached = _HEALTH_CACHE.get(device_or_mount)
+    if cached is not None and time.monotonic() - cached[1] < _HEALTH_TTL:
+        return dataclasses.replace(cached[0])
+
     info = DriveHealthInfo(device_path=device_or_mount)
-    system = platform.system()
 
     try:
-        if system == "Darwin":
-            _detect_macos(device_or_mount, info)
-        elif system == "Linux":
-            _detect_linux(device_or_mount, info)
-        elif system == "Windows":
-            _detect_windows(device_or_mount, info)
+        if _DETECTOR is not None:
+            _DETECTOR(device_or_mount, info)
     except Exception as e:
         logger.warning("Drive health detection failed: %s", e)
         info.is_unknown = True
 
     # Assess recovery feasibility
     _assess_recovery(info)
+    _HEALTH_CACHE[device_or_mount] = (dataclasses.replace(info), time.monotonic())
     return info
 
 
@@ -105,42 +131,35 @@ def _detect_macos(path: str, info: DriveHealthInfo):
     """Detect SSD/TRIM on macOS using diskutil and system_profiler."""
 
     # Normalize to disk identifier (strip /dev/, /dev/r, partition suffix)
-    disk_id = _macos_resolve_disk_id(path)
+    disk_id, d = _macos_resolve_disk_id(path)
     if not disk_id:
         return
 
-    # diskutil info gives us: Solid State, TRIM Support, Media Name
+    # diskutil info -plist gives us: SolidState, MediaName, BusProtocol
     try:
-        r = subprocess.run(
-            ["diskutil", "info", disk_id],
-            capture_output=True, text=True, timeout=10,
-        )
-        if r.returncode == 0:
-            output = r.stdout
-
-            # Solid State: Yes/No
-            m = re.search(r"Solid State:\s*(Yes|No)", output, re.IGNORECASE)
-            if m:
-                if m.group(1).lower() == "yes":
-                    info.is_ssd = True
-                    info.is_hdd = False
-                    info.is_unknown = False
-                    info.drive_type = "SSD"
-                else:
-                    info.is_ssd = False
-                    info.is_hdd = True
-                    info.is_unknown = False
-                    info.drive_type = "HDD"
+        if d is None:
+            d = _diskutil_info_plist(disk_id)
+        if d is not None:
+            # SolidState: True/False (absent when diskutil can't tell)
+            solid = d.get("SolidState")
+            if solid is True:
+                info.is_ssd = True
+                info.is_hdd = False
+                info.is_unknown = False
+                info.drive_type = "SSD"
+            elif solid is False:
+                info.is_ssd = False
+                info.is_hdd = True
+                info.is_unknown = False
+                info.drive_type = "HDD"
 
             # Device / Media Name
-            m = re.search(r"(?:Device / )?Media Name:\s*(.+)", output)
-            if m:
-                info.model = m.group(1).strip()
+            if d.get("MediaName"):
+                info.model = str(d["MediaName"]).strip()
 
             # Protocol (NVMe, USB, SATA, Thunderbolt, PCIe, FireWire)
-            m = re.search(r"Protocol:\s*(.+)", output)
-            if m:
-                proto = m.group(1).strip().lower()
+            proto = str(d.get("BusProtocol", "")).lower()
+            if proto:
                 if "nvme" in proto:
                     info.drive_type = "NVMe SSD"
                     info.is_ssd = True
@@ -172,17 +191,14 @@ def _detect_macos(path: str, info: DriveHealthInfo):
                     if info.is_ssd:
                         info.drive_type = "External SSD (FireWire)"
 
-            # Internal (Yes/No)
-            m = re.search(r"Device Location:\s*(Internal|External)", output, re.IGNORECASE)
-            if m:
-                if m.group(1).lower() == "external":
-                    info.is_external = True
-                    if info.is_ssd and "External" not in info.drive_type:
-                        info.drive_type = f"External SSD ({info.connection_type or 'USB'})"
+            # Internal: True/False
+            if d.get("Internal") is False:
+                info.is_external = True
+                if info.is_ssd and "External" not in info.drive_type:
+                    info.drive_type = f"External SSD ({info.connection_type or 'USB'})"
 
             # Removable Media
-            m = re.search(r"Removable Media:\s*(Yes|No)", output, re.IGNORECASE)
-            if m and m.group(1).lower() == "yes":
+            if d.get("RemovableMedia") is True:
                 info.is_external = True
                 if info.drive_type == "Unknown":
                     info.drive_type = "Removable"
@@ -194,63 +210,114 @@ def _detect_macos(path: str, info: DriveHealthInfo):
     _macos_check_trim(info)
 
 
-def _macos_resolve_disk_id(path: str) -> Optional[str]:
-    """Resolve a path to a macOS disk identifier like 'disk2' or 'disk2s1'."""
+def _diskutil_info_plist(target: str) -> Optional[dict]:
+    """Run ``diskutil info -plist`` and return the parsed property list."""
+    r = subprocess.run(
+        ["diskutil", "info", "-plist", target],
+        capture_output=True, timeout=10,
+    )
+    if r.returncode != 0:
+        return None
+    return plistlib.loads(r.stdout)
+
+
+def _macos_resolve_disk_id(path: str) -> tuple[Optional[str], Optional[dict]]:
+    """Resolve a path to a macOS disk identifier like 'disk2' or 'disk2s1'.
+
+    Returns ``(disk_id, diskutil_info)``.  The info dict is only set when
+    a mount point had to be looked up, so the caller can reuse it instead
+    of running ``diskutil info`` a second time.
+    """
     # Already a disk id
-    if re.match(r"disk\d+", path):
-        return path
+    if _RE_DISK_ID.match(path):
+        return path, None
 
     # /dev/disk2s1 or /dev/rdisk2s1
-    m = re.search(r"r?disk\d+(?:s\d+)?", path)
+    m = _RE_DEV_DISK.search(path)
     if m:
-        return m.group(0).lstrip("r")
+        return m.group(0).lstrip("r"), None
 
     # Mount point → diskutil info to get Device Identifier
     try:
-        r = subprocess.run(
-            ["diskutil", "info", path],
-            capture_output=True, text=True, timeout=10,
-        )
-        if r.returncode == 0:
-            m = re.search(r"Device Identifier:\s*(disk\d+(?:s\d+)?)", r.stdout)
-            if m:
-                return m.group(1)
+        d = _diskutil_info_plist(path)
+        if d is not None and d.get("DeviceIdentifier"):
+            return str(d["DeviceIdentifier"]), d
     except Exception:
         pass
 
-    return None
+    return None, None
+
+
+# system_profiler takes seconds per data type and its output is stable for
+# the session: data_type → (stdout, timestamp)
+_PROFILER_TTL = 300.0
+_PROFILER_CACHE: dict[str, tuple[str, float]] = {}
+
+
+def _cached_system_profiler(data_type: str, timeout: int) -> Optional[str]:
+    """Run ``system_profiler <data_type>`` at most once per TTL.
+
+    Returns stdout, or None if the command failed (failures aren't cached).
+    """
+    cached = _PROFILER_CACHE.get(data_type)
+    if cached is not None and time.monotonic() - cached[1] < _PROFILER_TTL:
+        return cached[0]
+    r = subprocess.run(
+        ["system_profiler", data_type],
+        capture_output=True, text=True, timeout=timeout,
+    )
+    if r.returncode != 0:
+        return None
+    _PROFILER_CACHE[data_type] = (r.stdout, time.monotonic())
+    return r.stdout
 
 
 def _macos_check_trim(info: DriveHealthInfo):
     """Check TRIM support on macOS via system_profiler."""
-    try:
-        # Check NVMe devices
-        r = subprocess.run(
-            ["system_profiler", "SPNVMeDataType"],
-            capture_output=True, text=True, timeout=15,
-        )
-        if r.returncode == 0 and info.model:
-            # Look for our drive's section
-            if info.model.lower() in r.stdout.lower() or "trim" in r.stdout.lower():
-                m = re.search(r"TRIM Support:\s*(Yes|No)", r.stdout, re.IGNORECASE)
+    conn = info.connection_type
+    if conn in ("USB", "Thunderbolt", "FireWire"):
+        # External enclosures rarely pass TRIM through, and the profiler
+        # output only describes internal buses — skip both probes.
+        info.trim_supported = False
+        info.trim_enabled = False
+    else:
+        try:
+            # NVMe probe is not needed if diskutil said SATA, and vice versa
+            wanted = [dt for dt, skip_for in (("SPNVMeDataType", "SATA"),
+                                              ("SPSerialATADataType", "NVMe"))
+                      if conn != skip_for]
+            if len(wanted) > 1:
+                # Independent multi-second probes — run them side by side
+                with ThreadPoolExecutor(max_workers=len(wanted)) as pool:
+                    outputs = dict(zip(wanted, pool.map(
+                        lambda dt: _cached_system_profiler(dt, 15), wanted)))
+            else:
+                outputs = {dt: _cached_system_profiler(dt, 15) for dt in wanted}
+            # Lowercase each report once; every check below is case-blind
+            outputs = {dt: out.lower() for dt, out in outputs.items()
+                       if out is not None}
+
+            # Check NVMe devices
+            out = outputs.get("SPNVMeDataType")
+            if out is not None and info.model:
+                # Look for our drive's section
+                if info.model.lower() in out or "trim" in out:
+                    m = _RE_TRIM_SUPPORT.search(out)
+                    if m:
+                        info.trim_supported = True
+                        info.trim_enabled = m.group(1) == "yes"
+                        return
+
+            # Check SATA devices
+            out = outputs.get("SPSerialATADataType")
+            if out is not None:
+                m = _RE_TRIM_SUPPORT.search(out)
                 if m:
                     info.trim_supported = True
-                    info.trim_enabled = m.group(1).lower() == "yes"
-                    return
-
-        # Check SATA devices
-        r = subprocess.run(
-            ["system_profiler", "SPSerialATADataType"],
-            capture_output=True, text=True, timeout=15,
-        )
-        if r.returncode == 0:
-            m = re.search(r"TRIM Support:\s*(Yes|No)", r.stdout, re.IGNORECASE)
-            if m:
-                info.trim_supported = True
-                info.trim_enabled = m.group(1).lower() == "yes"
+                    info.trim_enabled = m.group(1) == "yes"
 
-    except Exception as e:
-        logger.debug("system_profiler TRIM check failed: %s", e)
+        except Exception as e:
+            logger.debug("system_profiler TRIM check failed: %s", e)
 
     # Internal SSDs on modern macOS always have TRIM enabled
     if info.is_ssd and not info.trim_supported:
@@ -281,23 +348,20 @@ def _detect_linux(path: str, info: DriveHealthInfo):
     if not dev_name:
         return
 
+    attrs = _sysfs_device_snapshot(dev_name)
+
     # Check rotational flag in sysfs: 0 = SSD, 1 = HDD
-    rotational_path = f"/sys/block/{dev_name}/queue/rotational"
-    try:
-        with open(rotational_path) as f:
-            val = f.read().strip()
-            if val == "0":
-                info.is_ssd = True
-                info.is_hdd = False
-                info.is_unknown = False
-                info.drive_type = "SSD"
-            elif val == "1":
-                info.is_ssd = False
-                info.is_hdd = True
-                info.is_unknown = False
-                info.drive_type = "HDD"
-    except (FileNotFoundError, PermissionError):
-        pass
+    val = attrs["rotational"]
+    if val == "0":
+        info.is_ssd = True
+        info.is_hdd = False
+        info.is_unknown = False
+        info.drive_type = "SSD"
+    elif val == "1":
+        info.is_ssd = False
+        info.is_hdd = True
+        info.is_unknown = False
+        info.drive_type = "HDD"
 
     # Check if NVMe
     if dev_name.startswith("nvme"):
@@ -307,21 +371,17 @@ def _detect_linux(path: str, info: DriveHealthInfo):
         info.drive_type = "NVMe SSD"
 
     # Get model from sysfs
-    model_path = f"/sys/block/{dev_name}/device/model"
-    try:
-        with open(model_path) as f:
-            info.model = f.read().strip()
-    except (FileNotFoundError, PermissionError):
-        pass
+    model = attrs["model"]
+    if model is not None:
+        info.model = model
 
     # Check TRIM/DISCARD support
-    discard_path = f"/sys/block/{dev_name}/queue/discard_max_bytes"
-    try:
-        with open(discard_path) as f:
-            val = int(f.read().strip())
-            info.trim_supported = val > 0
-    except (FileNotFoundError, PermissionError, ValueError):
-        pass
+    val = attrs["discard_max_bytes"]
+    if val is not None:
+        try:
+            info.trim_supported = int(val) > 0
+        except ValueError:
+            pass
 
     # Check if filesystem is mounted with 'discard' option
     if info.trim_supported:
@@ -332,15 +392,56 @@ def _detect_linux(path: str, info: DriveHealthInfo):
         _linux_hdparm_trim(dev_name, info)
 
 
+def _read_sysfs(path: str) -> Optional[str]:
+    """Read a tiny sysfs attribute.  Returns None if missing/unreadable.
+
+    Uses a bare fd rather than open() — these files are a few bytes and
+    the buffered text-IO stack would dominate the cost.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, 256).decode(errors="replace").strip()
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+# sysfs attributes per base device.  Every partition of a disk resolves to
+# the same base device, so they share one read: dev_name → (attrs, timestamp)
+_SYSFS_TTL = 300.0
+_SYSFS_CACHE: dict[str, tuple[dict[str, Optional[str]], float]] = {}
+_SYSFS_ATTRS = (
+    ("rotational", "queue/rotational"),
+    ("model", "device/model"),
+    ("discard_max_bytes", "queue/discard_max_bytes"),
+)
+
+
+def _sysfs_device_snapshot(dev_name: str) -> dict[str, Optional[str]]:
+    """Read the sysfs attributes _detect_linux needs, at most once per TTL."""
+    cached = _SYSFS_CACHE.get(dev_name)
+    if cached is not None and time.monotonic() - cached[1] < _SYSFS_TTL:
+        return cached[0]
+    attrs = {key: _read_sysfs(f"/sys/block/{dev_name}/{rel}")
+             for key, rel in _SYSFS_ATTRS}
+    _SYSFS_CACHE[dev_name] = (attrs, time.monotonic())
+    return attrs
+
+
 def _linux_base_device(path: str) -> Optional[str]:
     """Extract base block device name from path."""
     # /dev/sda1 → sda,  /dev/nvme0n1p2 → nvme0n1
     if path.startswith("/dev/"):
         dev = os.path.basename(path)
         # Strip partition: sda1 → sda, nvme0n1p2 → nvme0n1
-        m = re.match(r"(nvme\d+n\d+|sd[a-z]+|vd[a-z]+|hd[a-z]+)", dev)
-        if m:
-            return m.group(1)
+        if dev.startswith("nvme"):
+            return dev.split("p", 1)[0]
+        if dev.startswith(("sd", "vd", "hd")):
+            return dev.rstrip("0123456789")
         return dev
 
     # Mount point → findmnt
@@ -359,31 +460,22 @@ def _linux_base_device(path: str) -> Optional[str]:
 
 def _linux_check_mount_discard(path: str, info: DriveHealthInfo):
     """Check if the filesystem is mounted with discard (auto-TRIM)."""
+    target = os.fsencode(path)
     try:
-        with open("/proc/mounts") as f:
+        with open("/proc/mounts", "rb") as f:
             for line in f:
-                parts = line.split()
-                if len(parts) >= 4:
-                    mount_point = parts[1]
-                    options = parts[3]
-                    if mount_point == path or parts[0] == path:
-                        if "discard" in options.split(","):
-                            info.trim_enabled = True
-                            return
+                # Cheap substring reject before tokenizing the line
+                if target not in line:
+                    continue
+                # device mount_point fstype options ...
+                parts = line.split(b" ", 4)
+                if len(parts) >= 4 and (parts[1] == target or parts[0] == target):
+                    if b",discard," in b"," + parts[3] + b",":
+                        info.trim_enabled = True
+                        return
     except (FileNotFoundError, PermissionError):
         pass
 
-    # Also check fstab for discard
-    try:
-        r = subprocess.run(
-            ["findmnt", "-no", "OPTIONS", path],
-            capture_output=True, text=True, timeout=10,
-        )
-        if r.returncode == 0 and "discard" in r.stdout:
-            info.trim_enabled = True
-    except Exception:
-        pass
-
 
 def _linux_hdparm_trim(dev_name: str, info: DriveHealthInfo):
     """Use hdparm to check TRIM support (requires root)."""
@@ -412,252 +504,273 @@ def _detect_windows(path: str, info: DriveHealthInfo):
     if len(drive_letter) > 2:
         drive_letter = drive_letter[0]
 
-    # Get physical disk info via PowerShell
+    # One PowerShell launch for both queries — CLR/PowerShell startup is
+    # the dominant cost, so don't pay it twice.
+    script = (
+        f"$d = Get-Partition -DriveLetter '{drive_letter}' | "
+        f"Get-Disk | Select MediaType, Model, SerialNumber, FirmwareVersion; "
+        f"$t = fsutil behavior query DisableDeleteNotify | Out-String; "
+        f"@{{disk=$d; trim=$t}} | ConvertTo-Json -Depth 3"
+    )
     try:
-        # Get disk number for the drive letter
-        cmd = (
-            f"Get-Partition -DriveLetter '{drive_letter}' | "
-            f"Get-Disk | Select MediaType, Model, SerialNumber, "
-            f"FirmwareVersion | ConvertTo-Json"
-        )
         r = subprocess.run(
-            ["powershell", "-Command", cmd],
-            capture_output=True, text=True, timeout=15,
+            # Skip profile scripts and the banner — they dominate startup
+            ["powershell", "-NoProfile", "-NonInteractive", "-NoLogo",
+             "-Command", script],
+            capture_output=True, text=True, timeout=20,
         )
-        if r.returncode == 0 and r.stdout.strip():
-            import json
-            data = json.loads(r.stdout)
-            media_type = str(data.get("MediaType", "")).lower()
-
-            if "ssd" in media_type or media_type == "4":
-                info.is_ssd = True
-                info.is_hdd = False
-                info.is_unknown = False
-                info.drive_type = "SSD"
-            elif "hdd" in media_type or media_type == "3":
-                info.is_ssd = False
-                info.is_hdd = True
-                info.is_unknown = False
-                info.drive_type = "HDD"
-
-            info.model = str(data.get("Model", "")).strip()
-            info.serial = str(data.get("SerialNumber", "")).strip()
-            info.firmware = str(data.get("FirmwareVersion", "")).strip()
+        if r.returncode != 0 or not r.stdout.strip():
+            return
+        result = json.loads(r.stdout)
     except Exception as e:
-        logger.debug("PowerShell disk info failed: %s", e)
+        logger.debug("PowerShell drive query failed: %s", e)
+        return
+
+    # Physical disk info
+    data = result.get("disk") or {}
+    if data:
+        media_type = str(data.get("MediaType", "")).lower()
+
+        if "ssd" in media_type or media_type == "4":
+            info.is_ssd = True
+            info.is_hdd = False
+            info.is_unknown = False
+            info.drive_type = "SSD"
+        elif "hdd" in media_type or media_type == "3":
+            info.is_ssd = False
+            info.is_hdd = True
+            info.is_unknown = False
+            info.drive_type = "HDD"
+
+        info.model = str(data.get("Model", "")).strip()
+        info.serial = str(data.get("SerialNumber", "")).strip()
+        info.firmware = str(data.get("FirmwareVersion", "")).strip()
 
     # Check TRIM (Windows calls it "Optimize" for SSDs)
-    try:
-        r = subprocess.run(
-            ["powershell", "-Command",
-             "fsutil behavior query DisableDeleteNotify"],
-            capture_output=True, text=True, timeout=10,
-        )
-        if r.returncode == 0:
-            # DisableDeleteNotify = 0 means TRIM IS enabled
-            # DisableDeleteNotify = 1 means TRIM IS disabled
-            output = r.stdout.lower()
-            if "disabledeletenotify = 0" in output or "= 0" in output:
-                info.trim_supported = True
-                info.trim_enabled = True
-            elif "disabledeletenotify = 1" in output or "= 1" in output:
-                info.trim_supported = True
-                info.trim_enabled = False
-    except Exception as e:
-        logger.debug("fsutil TRIM check failed: %s", e)
+    # DisableDeleteNotify = 0 means TRIM IS enabled
+    # DisableDeleteNotify = 1 means TRIM IS disabled
+    output = str(result.get("trim") or "").lower()
+    if "disabledeletenotify = 0" in output or "= 0" in output:
+        info.trim_supported = True
+        info.trim_enabled = True
+    elif "disabledeletenotify = 1" in output or "= 1" in output:
+        info.trim_supported = True
+        info.trim_enabled = False
+
+
+# Resolved once at import — the platform can't change under us
+_DETECTOR = {
+    "Darwin": _detect_macos,
+    "Linux": _detect_linux,
+    "Windows": _detect_windows,
+}.get(_PLATFORM)
 
 
 # ─────────────────────────────────────────────────────────────
 #  Recovery Feasibility Assessment
 # ─────────────────────────────────────────────────────────────
 
-def _assess_recovery(info: DriveHealthInfo):
-    """Determine recovery feasibility based on drive characteristics."""
-
-    dtype = info.drive_type.lower()
-
-    if info.is_ssd and info.trim_enabled and info.is_external:
-        # ── External SSD via USB/Thunderbolt/FireWire — TRIM often NOT passed ──
-        info.recovery_possible = True
-        info.recovery_confidence = "medium"
-        info.recovery_warning = (
-            f"⚡ External SSD detected ({info.connection_type or 'USB'}).\n\n"
-            f"Most {info.connection_type or 'USB'} enclosures do NOT pass TRIM commands\n"
-            "to the drive. Deleted data likely still exists on disk.\n\n"
-            "Recovery chances: MEDIUM to HIGH.\n"
-            "SSD wear-leveling may affect some results.\n\n"
-            f"Drive: {info.model or info.drive_type}\n"
-            "Confidence: MEDIUM"
-        )
-
-    elif "external ssd" in dtype and not info.trim_enabled:
-        # ── External SSD without TRIM — good recovery chances ──
-        info.recovery_possible = True
-        info.recovery_confidence = "medium"
-        info.recovery_warning = (
-            f"⚡ External SSD detected ({info.connection_type or 'USB'}).\n\n"
-            "TRIM is NOT active through the enclosure.\n"
-            "Deleted data should still be on the drive.\n\n"
-            "Recovery chances: MEDIUM to HIGH.\n"
-            "SSD wear-leveling may affect some results.\n\n"
-            f"Drive: {info.model or info.drive_type}\n"
-            "Confidence: MEDIUM-HIGH"
-        )
-
-    elif info.is_ssd and info.trim_enabled:
-        # ── Internal SSD + TRIM — recovery difficult but worth trying ──
-        info.recovery_possible = True
-        info.recovery_confidence = "low"
-        info.recovery_warning = (
-            "⚠️ SSD with TRIM ENABLED detected.\n\n"
-            "TRIM erases deleted blocks at hardware level, making\n"
-            "recovery difficult. However, scanning is still worth trying:\n\n"
-            "✓ Recently deleted files (seconds/minutes ago) may survive\n"
-            "  if TRIM hasn't executed yet\n"
-            "✓ Large files may be partially recoverable\n"
-            "✓ Filesystem metadata/journal may contain references\n"
-            "✓ SSD garbage collection varies by manufacturer\n\n"
-            f"Drive: {info.model or info.drive_type}\n"
-            "TRIM: Active\n"
-            "Confidence: LOW — but recovery will be attempted"
-        )
-
-    elif info.is_ssd and info.trim_supported and not info.trim_enabled:
-        # SSD but TRIM disabled — unusual, some recovery possible
-        info.recovery_possible = True
-        info.recovery_confidence = "medium"
-        info.recovery_warning = (
-            "⚠️ SSD detected, but TRIM appears DISABLED.\n\n"
-            "Recovery MAY be possible since TRIM is not active.\n"
-            "However, SSD wear-leveling can still affect results.\n\n"
-            f"Drive: {info.model or info.drive_type}\n"
-            "Confidence: MEDIUM"
-        )
-
-    elif info.is_ssd and not info.trim_supported:
-        # SSD without TRIM support (older SSD or USB flash)
-        info.recovery_possible = True
-        info.recovery_confidence = "medium"
-        info.recovery_warning = (
-            "⚠️ SSD/Flash drive without TRIM support detected.\n\n"
-            "Recovery is possible, but wear-leveling may affect results.\n\n"
-            f"Drive: {info.model or info.drive_type}\n"
-            "Confidence: MEDIUM"
-        )
-
-    elif "usb" in dtype or "pendrive" in dtype or "flash" in dtype:
-        # USB flash drive — medium recovery (no TRIM usually, but FTL exists)
-        info.recovery_possible = True
-        info.recovery_confidence = "medium"
-        info.is_unknown = False
-        info.recovery_warning = (
-            "🔌 USB Flash Drive detected.\n\n"
-            "USB drives do not use TRIM — deleted data persists until\n"
-            "overwritten. Recovery chances are MEDIUM to HIGH.\n\n"
-            "Flash Translation Layer (FTL) may remap blocks internally,\n"
-            "but most data should still be recoverable.\n\n"
-            f"Drive: {info.model or info.drive_type}\n"
-            "Confidence: MEDIUM-HIGH"
-        )
-
-    elif "sd card" in dtype or "memory card" in dtype or "cf card" in dtype:
-        # SD / CF / Memory cards — medium recovery
-        info.recovery_possible = True
-        info.recovery_confidence = "medium"
-        info.is_unknown = False
-        info.recovery_warning = (
-            "💳 Memory Card (SD/CF) detected.\n\n"
-            "Memory cards do not use TRIM. Deleted data persists until\n"
-            "overwritten. Recovery chances are MEDIUM to HIGH.\n\n"
-            "Avoid writing new data to the card before recovery.\n\n"
-            f"Drive: {info.model or info.drive_type}\n"
-            "Confidence: MEDIUM-HIGH"
-        )
+# Warning templates — only {conn} (connection type) and {drive} (model or
+# drive type) vary per call.
+_WARN_EXTERNAL_SSD_TRIM = (
+    "⚡ External SSD detected ({conn}).\n\n"
+    "Most {conn} enclosures do NOT pass TRIM commands\n"
+    "to the drive. Deleted data likely still exists on disk.\n\n"
+    "Recovery chances: MEDIUM to HIGH.\n"
+    "SSD wear-leveling may affect some results.\n\n"
+    "Drive: {drive}\n"
+    "Confidence: MEDIUM"
+)
+_WARN_EXTERNAL_SSD = (
+    "⚡ External SSD detected ({conn}).\n\n"
+    "TRIM is NOT active through the enclosure.\n"
+    "Deleted data should still be on the drive.\n\n"
+    "Recovery chances: MEDIUM to HIGH.\n"
+    "SSD wear-leveling may affect some results.\n\n"
+    "Drive: {drive}\n"
+    "Confidence: MEDIUM-HIGH"
+)
+_WARN_SSD_TRIM = (
+    "⚠️ SSD with TRIM ENABLED detected.\n\n"
+    "TRIM erases deleted blocks at hardware level, making\n"
+    "recovery difficult. However, scanning is still worth trying:\n\n"
+    "✓ Recently deleted files (seconds/minutes ago) may survive\n"
+    "  if TRIM hasn't executed yet\n"
+    "✓ Large files may be partially recoverable\n"
+    "✓ Filesystem metadata/journal may contain references\n"
+    "✓ SSD garbage collection varies by manufacturer\n\n"
+    "Drive: {drive}\n"
+    "TRIM: Active\n"
+    "Confidence: LOW — but recovery will be attempted"
+)
+_WARN_SSD_TRIM_DISABLED = (
+    "⚠️ SSD detected, but TRIM appears DISABLED.\n\n"
+    "Recovery MAY be possible since TRIM is not active.\n"
+    "However, SSD wear-leveling can still affect results.\n\n"
+    "Drive: {drive}\n"
+    "Confidence: MEDIUM"
+)
+_WARN_SSD_NO_TRIM = (
+    "⚠️ SSD/Flash drive without TRIM support detected.\n\n"
+    "Recovery is possible, but wear-leveling may affect results.\n\n"
+    "Drive: {drive}\n"
+    "Confidence: MEDIUM"
+)
+_WARN_USB_FLASH = (
+    "🔌 USB Flash Drive detected.\n\n"
+    "USB drives do not use TRIM — deleted data persists until\n"
+    "overwritten. Recovery chances are MEDIUM to HIGH.\n\n"
+    "Flash Translation Layer (FTL) may remap blocks internally,\n"
+    "but most data should still be recoverable.\n\n"
+    "Drive: {drive}\n"
+    "Confidence: MEDIUM-HIGH"
+)
+_WARN_MEMORY_CARD = (
+    "💳 Memory Card (SD/CF) detected.\n\n"
+    "Memory cards do not use TRIM. Deleted data persists until\n"
+    "overwritten. Recovery chances are MEDIUM to HIGH.\n\n"
+    "Avoid writing new data to the card before recovery.\n\n"
+    "Drive: {drive}\n"
+    "Confidence: MEDIUM-HIGH"
+)
+_WARN_EMMC_DISCARD = (
+    "📱 eMMC storage with DISCARD detected.\n\n"
+    "eMMC with active DISCARD may have erased deleted blocks.\n"
+    "Recovery chances are LOW.\n\n"
+    "Drive: {drive}\n"
+    "Confidence: LOW"
+)
+_WARN_EMMC = (
+    "📱 eMMC storage detected.\n\n"
+    "eMMC without DISCARD preserves deleted data.\n"
+    "Recovery chances are MEDIUM.\n\n"
+    "Drive: {drive}\n"
+    "Confidence: MEDIUM"
+)
+_WARN_OPTICAL = (
+    "💿 Optical disc detected.\n\n"
+    "Data on optical media (CD/DVD/Blu-ray) is typically permanent.\n"
+    "Recovery of readable sectors has HIGH confidence.\n"
+    "Damaged/scratched areas may have errors.\n\n"
+    "Drive: {drive}\n"
+    "Confidence: HIGH (for readable sectors)"
+)
+_WARN_VIRTUAL = (
+    "🖥️ Virtual disk detected.\n\n"
+    "Virtual disks (VMware/VirtualBox/Hyper-V) do not have\n"
+    "hardware-level TRIM. Deleted data should be fully recoverable.\n\n"
+    "Drive: {drive}\n"
+    "Confidence: HIGH"
+)
+_WARN_DISK_IMAGE = (
+    "📀 Disk image file detected.\n\n"
+    "Disk images are static snapshots — all data including deleted\n"
+    "files is preserved exactly as captured.\n\n"
+    "Drive: {drive}\n"
+    "Confidence: HIGH"
+)
+_WARN_HDD = (
+    "✅ HDD detected — best conditions for data recovery.\n\n"
+    "Deleted files remain on disk until overwritten.\n"
+    "The sooner you scan, the better the chances.\n\n"
+    "Drive: {drive}\n"
+    "Confidence: HIGH"
+)
+_WARN_UNKNOWN = (
+    "ℹ️ Could not determine drive type.\n\n"
+    "Recovery will be attempted, but results depend on\n"
+    "the actual hardware.\n\n"
+    "• USB flash / SD card: MEDIUM-HIGH\n"
+    "• External HDD: HIGH\n"
+    "• SSD with TRIM: NONE\n"
+    "• Disk image: HIGH"
+)
+
+# drive_type keywords → category tag.  A drive type can carry several tags
+# ("External SSD (USB)" is both external_ssd and usb_flash); the rule order
+# below decides which one wins.
+_CATEGORY_KEYWORDS = (
+    ("external_ssd", ("external ssd",)),
+    ("usb_flash", ("usb", "pendrive", "flash")),
+    ("memory_card", ("sd card", "memory card", "cf card")),
+    ("emmc", ("emmc",)),
+    ("optical", ("optical", "cd", "dvd")),
+    ("virtual", ("virtual",)),
+    ("disk_image", ("disk image",)),
+)
+
+
+@lru_cache(maxsize=64)
+def _drive_categories(drive_type: str) -> frozenset[str]:
+    """Category tags for a drive type string (computed once per string)."""
+    dtype = drive_type.lower()
+    return frozenset(tag for tag, words in _CATEGORY_KEYWORDS
+                     if any(w in dtype for w in words))
+
+
+# (predicate(info, categories), confidence, marks drive type known, template)
+# — evaluated in order, first match wins.
+_RECOVERY_RULES = [
+    # External SSD via USB/Thunderbolt/FireWire — TRIM often NOT passed
+    (lambda i, c: i.is_ssd and i.trim_enabled and i.is_external,
+     "medium", False, _WARN_EXTERNAL_SSD_TRIM),
+    # External SSD without TRIM — good recovery chances
+    (lambda i, c: "external_ssd" in c and not i.trim_enabled,
+     "medium", False, _WARN_EXTERNAL_SSD),
+    # Internal SSD + TRIM — recovery difficult but worth trying
+    (lambda i, c: i.is_ssd and i.trim_enabled,
+     "low", False, _WARN_SSD_TRIM),
+    # SSD but TRIM disabled — unusual, some recovery possible
+    (lambda i, c: i.is_ssd and i.trim_supported and not i.trim_enabled,
+     "medium", False, _WARN_SSD_TRIM_DISABLED),
+    # SSD without TRIM support (older SSD or USB flash)
+    (lambda i, c: i.is_ssd and not i.trim_supported,
+     "medium", False, _WARN_SSD_NO_TRIM),
+    # USB flash drive — medium recovery (no TRIM usually, but FTL exists)
+    (lambda i, c: "usb_flash" in c,
+     "medium", True, _WARN_USB_FLASH),
+    # SD / CF / Memory cards — medium recovery
+    (lambda i, c: "memory_card" in c,
+     "medium", True, _WARN_MEMORY_CARD),
+    # eMMC — some devices support TRIM/DISCARD
+    (lambda i, c: "emmc" in c and i.trim_enabled,
+     "low", False, _WARN_EMMC_DISCARD),
+    (lambda i, c: "emmc" in c,
+     "medium", False, _WARN_EMMC),
+    # Optical media — data is usually permanent
+    (lambda i, c: "optical" in c,
+     "high", True, _WARN_OPTICAL),
+    # Virtual disk (VM) — excellent recovery
+    (lambda i, c: "virtual" in c,
+     "high", True, _WARN_VIRTUAL),
+    # Disk image file — excellent recovery
+    (lambda i, c: "disk_image" in c,
+     "high", True, _WARN_DISK_IMAGE),
+    # HDD — best case for recovery
+    (lambda i, c: i.is_hdd,
+     "high", False, _WARN_HDD),
+]
 
-    elif "emmc" in dtype:
-        # eMMC — some devices support TRIM/DISCARD
-        info.recovery_possible = True
-        if info.trim_enabled:
-            info.recovery_confidence = "low"
-            info.recovery_warning = (
-                "📱 eMMC storage with DISCARD detected.\n\n"
-                "eMMC with active DISCARD may have erased deleted blocks.\n"
-                "Recovery chances are LOW.\n\n"
-                f"Drive: {info.model or info.drive_type}\n"
-                "Confidence: LOW"
-            )
-        else:
-            info.recovery_confidence = "medium"
-            info.recovery_warning = (
-                "📱 eMMC storage detected.\n\n"
-                "eMMC without DISCARD preserves deleted data.\n"
-                "Recovery chances are MEDIUM.\n\n"
-                f"Drive: {info.model or info.drive_type}\n"
-                "Confidence: MEDIUM"
-            )
-
-    elif "optical" in dtype or "cd" in dtype or "dvd" in dtype:
-        # Optical media — data is usually permanent
-        info.recovery_possible = True
-        info.recovery_confidence = "high"
-        info.is_unknown = False
-        info.recovery_warning = (
-            "💿 Optical disc detected.\n\n"
-            "Data on optical media (CD/DVD/Blu-ray) is typically permanent.\n"
-            "Recovery of readable sectors has HIGH confidence.\n"
-            "Damaged/scratched areas may have errors.\n\n"
-            f"Drive: {info.model or info.drive_type}\n"
-            "Confidence: HIGH (for readable sectors)"
-        )
-
-    elif "virtual" in dtype:
-        # Virtual disk (VM) — excellent recovery
-        info.recovery_possible = True
-        info.recovery_confidence = "high"
-        info.is_unknown = False
-        info.recovery_warning = (
-            "🖥️ Virtual disk detected.\n\n"
-            "Virtual disks (VMware/VirtualBox/Hyper-V) do not have\n"
-            "hardware-level TRIM. Deleted data should be fully recoverable.\n\n"
-            f"Drive: {info.model or info.drive_type}\n"
-            "Confidence: HIGH"
-        )
 
-    elif "disk image" in dtype:
-        # Disk image file — excellent recovery
-        info.recovery_possible = True
-        info.recovery_confidence = "high"
-        info.is_unknown = False
-        info.recovery_warning = (
-            "📀 Disk image file detected.\n\n"
-            "Disk images are static snapshots — all data including deleted\n"
-            "files is preserved exactly as captured.\n\n"
-            f"Drive: {info.model or info.drive_type}\n"
-            "Confidence: HIGH"
-        )
+def _assess_recovery(info: DriveHealthInfo):
+    """Determine recovery feasibility based on drive characteristics."""
 
-    elif info.is_hdd:
-        # HDD — best case for recovery
-        info.recovery_possible = True
-        info.recovery_confidence = "high"
-        info.recovery_warning = (
-            "✅ HDD detected — best conditions for data recovery.\n\n"
-            "Deleted files remain on disk until overwritten.\n"
-            "The sooner you scan, the better the chances.\n\n"
-            f"Drive: {info.model or info.drive_type}\n"
-            "Confidence: HIGH"
-        )
+    categories = _drive_categories(info.drive_type)
+    info.recovery_possible = True
 
+    for predicate, confidence, known, template in _RECOVERY_RULES:
+        if predicate(info, categories):
+            break
     else:
         # Unknown drive type
-        info.recovery_possible = True
         info.recovery_confidence = "unknown"
-        info.recovery_warning = (
-            "ℹ️ Could not determine drive type.\n\n"
-            "Recovery will be attempted, but results depend on\n"
-            "the actual hardware.\n\n"
-            "• USB flash / SD card: MEDIUM-HIGH\n"
-            "• External HDD: HIGH\n"
-            "• SSD with TRIM: NONE\n"
-            "• Disk image: HIGH"
-        )
+        info.recovery_warning = _WARN_UNKNOWN
+        return
+
+    info.recovery_confidence = confidence
+    if known:
+        info.is_unknown = False
+    info.recovery_warning = template.format(
+        conn=info.connection_type or "USB",
+        drive=info.model or info.drive_type,
+    )
@@ -15,10 +15,14 @@ from __future__ import annotations
 
 import os
 import time
+import queue
 import struct
 import logging
 import threading
-from typing import Optional, Callable
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Callable, Iterator
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -31,6 +35,37 @@ except ImportError:
     HAS_TSK = False
     logger.info("pytsk3 not installed — filesystem-level recovery disabled")
 
+if HAS_TSK:
+    # Bound once so the per-entry loop doesn't look them up on pytsk3
+    _TYPE_DIR = pytsk3.TSK_FS_META_TYPE_DIR
+    _TYPE_REG = pytsk3.TSK_FS_META_TYPE_REG
+    _FLAG_UNALLOC_META = pytsk3.TSK_FS_META_FLAG_UNALLOC
+    _FLAG_UNALLOC_NAME = pytsk3.TSK_FS_NAME_FLAG_UNALLOC
+    _NAME_TYPE_REG = pytsk3.TSK_FS_NAME_TYPE_REG
+    _DATA_ATTR_TYPES = (
+        pytsk3.TSK_FS_ATTR_TYPE_DEFAULT,
+        pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA,
+    )
+    _FS_NAMES = {
+        pytsk3.TSK_FS_TYPE_NTFS: "NTFS",
+        pytsk3.TSK_FS_TYPE_FAT12: "FAT12",
+        pytsk3.TSK_FS_TYPE_FAT16: "FAT16",
+        pytsk3.TSK_FS_TYPE_FAT32: "FAT32",
+        pytsk3.TSK_FS_TYPE_EXFAT: "exFAT",
+        pytsk3.TSK_FS_TYPE_HFS: "HFS+",
+        pytsk3.TSK_FS_TYPE_EXT2: "ext2",
+        pytsk3.TSK_FS_TYPE_EXT3: "ext3",
+        pytsk3.TSK_FS_TYPE_EXT4: "ext4",
+        pytsk3.TSK_FS_TYPE_ISO9660: "ISO9660",
+        pytsk3.TSK_FS_TYPE_FFS1: "UFS1",
+        pytsk3.TSK_FS_TYPE_FFS2: "UFS2",
+    }
+
+try:
+    import fcntl
+except ImportError:     # Windows
+    fcntl = None
+
 
 # ── Extensions by category (all 9 recovery categories) ──────
 
@@ -94,24 +129,55 @@ for _cat, _exts in _CATEGORY_EXTS.items():
             _EXT_TO_CATEGORY[_ext] = _cat
 
 # Flat set of all known extensions
-_ALL_EXTS: set[str] = set()
-for _exts in _CATEGORY_EXTS.values():
-    _ALL_EXTS |= _exts
+_ALL_EXTS: frozenset[str] = frozenset().union(*_CATEGORY_EXTS.values())
 
 # Legacy aliases
 _IMAGE_EXTS = _CATEGORY_EXTS["Image"]
 _VIDEO_EXTS = _CATEGORY_EXTS["Video"]
 
+# save_tsk_file copy size — large enough to keep NVMe queues busy
+_SAVE_CHUNK = 8 * 1024 * 1024
+
+# Files scan_deleted_files_iter lets the worker run ahead of its consumer
+_STREAM_BACKLOG = 1024
+
+# Minimum seconds between traversal progress messages
+_STATUS_INTERVAL = 0.25
+
+# os.pread is missing on Windows — fall back to seek + read there
+_HAS_PREAD = hasattr(os, "pread")
+
 # Maximum time for TSK scan before we give up and proceed to carving
 TSK_TIMEOUT = 60  # seconds
 
+def _env_workers() -> int:
+    """IRONROD_TSK_WORKERS as a thread count (1 if unset or malformed)."""
+    try:
+        return max(1, int(os.environ.get("IRONROD_TSK_WORKERS", "1")))
+    except ValueError:
+        return 1
+
+
+# Threads walking the directory tree.  1 keeps the sequential stack walk;
+# larger values opt in to the threaded walk (pytsk3 drops the GIL inside
+# TSK, so metadata reads for different directories can overlap).  Set
+# IRONROD_TSK_WORKERS, or pass workers= to scan_deleted_files().
+TSK_WORKERS = _env_workers()
+
 
 def _ext_category(ext: str) -> str:
     """Map a file extension to its recovery category."""
     return _EXT_TO_CATEGORY.get(ext.lower(), "")
 
 
-@dataclass
+@lru_cache(maxsize=32)
+def _wanted_exts_for(categories: frozenset[str]) -> frozenset[str]:
+    """Extensions to recover for a category selection (all if it's empty)."""
+    wanted = frozenset().union(*(_CATEGORY_EXTS.get(cat, ()) for cat in categories))
+    return wanted or _ALL_EXTS
+
+
+@dataclass(slots=True)
 class TSKDeletedFile:
     """A deleted file found via filesystem directory traversal."""
     name: str               # Original filename
@@ -125,6 +191,38 @@ class TSKDeletedFile:
     deleted_time: float = 0.0  # Deletion timestamp if available
 
 
+@dataclass(slots=True)
+class _ScanStats:
+    """Traversal counters shared by the directory walker(s)."""
+    entries: int = 0
+    dirs: int = 0
+
+
+class _InodeBitmap:
+    """Sparse visited-inode bitmap: one 8 KiB block per 64Ki inodes touched.
+
+    A flat bitmap sized from last_inum is not safe — FAT/exFAT number inodes
+    by directory-entry slot, so last_inum tracks the volume size (billions
+    on a large card) rather than the file count.  Blocks are only allocated
+    where visited inodes actually fall.
+    """
+    __slots__ = ("blocks",)
+
+    def __init__(self):
+        self.blocks: dict[int, bytearray] = {}
+
+    def add(self, inode: int) -> bool:
+        """Mark *inode* visited; returns False if it already was."""
+        block = self.blocks.get(inode >> 16)
+        if block is None:
+            block = self.blocks[inode >> 16] = bytearray(8192)
+        byte, bit = (inode >> 3) & 8191, 1 << (inode & 7)
+        if block[byte] & bit:
+            return False
+        block[byte] |= bit
+        return True
+
+
 class RawDeviceImgInfo(pytsk3.Img_Info if HAS_TSK else object):
     """pytsk3 Img_Info wrapper for a raw block device or disk image.
 
@@ -134,23 +232,66 @@ class RawDeviceImgInfo(pytsk3.Img_Info if HAS_TSK else object):
     read/get_size interface pytsk3 expects.
     """
 
+    # Small reads are served from an aligned readahead slab; pytsk3 asks
+    # for one sector or cluster at a time while walking metadata.
+    _SLAB = 128 * 1024
+    _SLAB_MAX = 1024 * 1024     # larger reads bypass the slab
+
     def __init__(self, device_path: str):
         self._device_path = device_path
-        self._fh = open(device_path, "rb")
+        flags = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+        try:
+            # Don't dirty the inode's atime on every forensic read
+            self._fd = os.open(device_path, flags | getattr(os, "O_NOATIME", 0))
+        except PermissionError:
+            # O_NOATIME needs ownership of the file (or CAP_FOWNER)
+            self._fd = os.open(device_path, flags)
+        if fcntl is not None and hasattr(fcntl, "F_NOCACHE"):
+            # macOS: we keep our own slab, skip the unified buffer cache
+            try:
+                fcntl.fcntl(self._fd, fcntl.F_NOCACHE, 1)
+            except OSError:
+                pass
         # Get device size
-        self._fh.seek(0, 2)
-        self._size = self._fh.tell()
-        self._fh.seek(0)
+        self._size = os.lseek(self._fd, 0, os.SEEK_END)
+        # Guards the slab, and seek + read where there is no pread
+        self._lock = threading.Lock()
+        self._cache_off = 0
+        self._cache_buf = b""
         super().__init__(url="", type=pytsk3.TSK_IMG_TYPE_RAW)
 
     def close(self):
-        if self._fh:
-            self._fh.close()
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _read_at(self, offset: int, length: int) -> bytes:
+        """Positional read; without pread the caller must hold the lock."""
+        if _HAS_PREAD:
+            return os.pread(self._fd, length, offset)
+        os.lseek(self._fd, offset, os.SEEK_SET)
+        return os.read(self._fd, length)
 
     def read(self, offset: int, length: int) -> bytes:
         """Read from the device at a specific offset."""
-        self._fh.seek(offset)
-        return self._fh.read(length)
+        if length > self._SLAB_MAX:
+            if _HAS_PREAD:
+                return self._read_at(offset, length)
+            with self._lock:
+                return self._read_at(offset, length)
+
+        with self._lock:
+            start = offset - self._cache_off
+            if start >= 0 and start + length <= len(self._cache_buf):
+                return self._cache_buf[start:start + length]
+            # Refill with the aligned slab(s) covering the request
+            base = offset - offset % self._SLAB
+            span = offset + length - base
+            span += -span % self._SLAB
+            buf = self._read_at(base, span)
+            self._cache_off, self._cache_buf = base, buf
+        start = offset - base
+        return buf[start:start + length]
 
     def get_size(self) -> int:
         return self._size
@@ -164,14 +305,16 @@ def scan_deleted_files(
     on_status: Optional[Callable[[str], None]] = None,
     timeout: float = TSK_TIMEOUT,
     categories: Optional[set[str]] = None,
+    workers: Optional[int] = None,
 ) -> list[TSKDeletedFile]:
     """
     Scan a raw device for deleted files using TSK.
 
-    Runs the actual filesystem traversal in a **separate thread** with a
-    timeout so it never blocks the main scan pipeline.  If the timeout is
-    reached, whatever files have been found so far are returned and raw
-    carving can proceed immediately.
+    Collects scan_deleted_files_iter(), which runs the actual filesystem
+    traversal in a **separate thread** with a timeout so it never blocks
+    the main scan pipeline.  If the timeout is reached, whatever files
+    have been found so far are returned and raw carving can proceed
+    immediately.
 
     Args:
         device_path:  Raw device path (e.g. /dev/rdisk2s1) or disk image.
@@ -181,66 +324,153 @@ def scan_deleted_files(
         on_status:    Callback for status messages.
         timeout:      Maximum seconds for TSK scan (default 60).
         categories:   Set of category names to recover (None = all).
+        workers:      Directory-walk threads (None = TSK_WORKERS).
 
     Returns:
         List of TSKDeletedFile objects found (may be partial on timeout).
     """
+    deleted_files: list[TSKDeletedFile] = []
+    for tsk_file in scan_deleted_files_iter(
+        device_path, want_image, want_video, on_status,
+        timeout, categories, workers,
+    ):
+        deleted_files.append(tsk_file)
+        if on_file_found:
+            on_file_found(tsk_file)
+
+    logger.info("TSK: Returning %d deleted files", len(deleted_files))
+    return deleted_files
+
+
+def scan_deleted_files_iter(
+    device_path: str,
+    want_image: bool = True,
+    want_video: bool = True,
+    on_status: Optional[Callable[[str], None]] = None,
+    timeout: float = TSK_TIMEOUT,
+    categories: Optional[set[str]] = None,
+    workers: Optional[int] = None,
+) -> Iterator[TSKDeletedFile]:
+    """Streaming variant of scan_deleted_files().
+
+    Yields each deleted file as the worker thread finds it instead of
+    collecting them in a list.  The worker pauses once the consumer is
+    _STREAM_BACKLOG files behind.  The scan is cancelled when *timeout*
+    seconds have passed or the generator is closed early.
+    """
     if not HAS_TSK:
         logger.warning("pytsk3 not installed — skipping TSK scan")
-        return []
+        return
 
     if on_status:
         on_status("🔍 TSK: Opening device for filesystem analysis...")
 
-    deleted_files: list[TSKDeletedFile] = []
+    out_q: queue.Queue = queue.Queue(maxsize=_STREAM_BACKLOG)
     cancel_event = threading.Event()
+    sink = _QueueSink(out_q, cancel_event)
     error_holder: list[str] = []
+    done = object()
 
     def _worker():
-        """Runs the full TSK scan; writes results into *deleted_files*."""
         try:
             _do_tsk_scan(
                 device_path, want_image, want_video,
-                deleted_files, on_file_found, on_status,
-                cancel_event, categories,
+                sink, None, on_status, cancel_event, categories, workers,
             )
         except Exception as exc:
             error_holder.append(str(exc))
             logger.warning("TSK worker error: %s", exc)
+        finally:
+            sink.put(done)
 
-    worker = threading.Thread(target=_worker, daemon=True)
-    worker.start()
-    worker.join(timeout=timeout)
-
-    if worker.is_alive():
-        # TSK scan is taking too long — signal cancellation
+    threading.Thread(target=_worker, daemon=True).start()
+    deadline = time.monotonic() + timeout
+    timed_out = False
+    yielded = 0
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                item = out_q.get(timeout=max(remaining, 0.0))
+            except queue.Empty:
+                timed_out = True
+                break
+            if item is done:
+                break
+            yielded += 1
+            yield item
+        if timed_out:
+            # Stop the worker, then hand over what it had already queued
+            cancel_event.set()
+            while True:
+                try:
+                    item = out_q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not done:
+                    yielded += 1
+                    yield item
+    finally:
         cancel_event.set()
+    _report_scan_end(on_status, timed_out, timeout, yielded, error_holder)
+
+
+class _QueueSink:
+    """List-like result target for _do_tsk_scan that feeds a bounded queue."""
+
+    def __init__(self, out_q: queue.Queue, cancel: threading.Event):
+        self._q = out_q
+        self._cancel = cancel
+        self._count = 0
+
+    def put(self, item) -> None:
+        # Poll so a cancelled scan never blocks forever on a full queue
+        while not self._cancel.is_set():
+            try:
+                self._q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def append(self, tsk_file: TSKDeletedFile) -> None:
+        self._count += 1
+        self.put(tsk_file)
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def _report_scan_end(
+    on_status: Optional[Callable[[str], None]],
+    timed_out: bool,
+    timeout: float,
+    found: int,
+    errors: list[str],
+):
+    """Log and report how a TSK scan ended."""
+    if timed_out:
         logger.info(
             "TSK: Timed out after %.0fs, proceeding with %d files found so far",
-            timeout, len(deleted_files),
+            timeout, found,
         )
         if on_status:
             on_status(
                 f"⏱️ TSK: Timed out after {timeout:.0f}s — "
-                f"found {len(deleted_files)} deleted files, "
+                f"found {found} deleted files, "
                 f"proceeding to raw carving..."
             )
-        # Don't block waiting — let the daemon thread die on its own
     else:
         # Finished in time
-        if error_holder:
+        if errors:
             if on_status:
-                on_status(f"⚠️ TSK: {error_holder[0]}")
-        elif deleted_files:
+                on_status(f"⚠️ TSK: {errors[0]}")
+        elif found:
             if on_status:
-                on_status(f"✅ TSK: Found {len(deleted_files)} deleted files via filesystem analysis")
+                on_status(f"✅ TSK: Found {found} deleted files via filesystem analysis")
         else:
             if on_status:
                 on_status("ℹ️ TSK: No deleted files found in filesystem metadata")
 
-    logger.info("TSK: Returning %d deleted files", len(deleted_files))
-    return deleted_files
-
 
 def _do_tsk_scan(
     device_path: str,
@@ -251,6 +481,7 @@ def _do_tsk_scan(
     on_status: Optional[Callable],
     cancel: threading.Event,
     categories: Optional[set[str]] = None,
+    workers: Optional[int] = None,
 ):
     """Internal TSK scan logic — runs inside a worker thread."""
 
@@ -278,25 +509,16 @@ def _do_tsk_scan(
     if on_status:
         on_status(f"🔍 TSK: Traversing {fs_type_name} directory tree for deleted files...")
 
-    # Determine which extensions to look for
-    wanted_exts: set[str] = set()
-    if categories is not None:
-        # Use the categories set — includes all 9 categories
-        for cat in categories:
-            wanted_exts |= _CATEGORY_EXTS.get(cat, set())
-    else:
+    # Determine which extensions to look for (empty selection = everything)
+    if categories is None:
         # Legacy fallback: use want_image / want_video booleans
-        if want_image:
-            wanted_exts |= _IMAGE_EXTS
-        if want_video:
-            wanted_exts |= _VIDEO_EXTS
-    # If still empty, scan everything
-    if not wanted_exts:
-        wanted_exts = _ALL_EXTS
-
-    visited_inodes: set[int] = set()
-    dirs_visited = [0]
-    entries_scanned = [0]
+        categories = {cat for cat, want in (("Image", want_image),
+                                            ("Video", want_video)) if want}
+    wanted_exts = _wanted_exts_for(frozenset(categories))
+
+    visited_inodes = _InodeBitmap()
+    found_inodes: set[int] = set()      # inodes already reported
+    stats = _ScanStats()
 
     # Traverse the directory tree
     try:
@@ -304,8 +526,8 @@ def _do_tsk_scan(
         _traverse_directory(
             fs_info, root_dir, "/", device_path,
             wanted_exts, results, on_file_found, on_status,
-            visited_inodes, cancel, dirs_visited, entries_scanned,
-            depth=0,
+            visited_inodes, found_inodes, cancel, stats,
+            workers=workers or TSK_WORKERS,
         )
     except Exception as exc:
         if not cancel.is_set():
@@ -321,7 +543,7 @@ def _do_tsk_scan(
         _find_orphan_files(
             fs_info, device_path, wanted_exts,
             results, on_file_found, cancel,
-            existing_inodes={f.inode for f in results},
+            existing_inodes=found_inodes,
         )
     except Exception as exc:
         if not cancel.is_set():
@@ -333,153 +555,310 @@ def _traverse_directory(
     directory,
     path: str,
     device_path: str,
-    wanted_exts: set[str],
+    wanted_exts: frozenset[str],
     results: list[TSKDeletedFile],
     on_file_found: Optional[Callable],
     on_status: Optional[Callable],
-    visited_inodes: set[int],
+    visited_inodes: _InodeBitmap,
+    found_inodes: set[int],
     cancel: threading.Event,
-    dirs_visited: list[int],
-    entries_scanned: list[int],
-    depth: int,
+    stats: _ScanStats,
+    workers: int = 1,
 ):
-    """Recursively traverse directories, collecting deleted image/video files.
+    """Walk the directory tree under *directory*, collecting deleted files.
 
-    Checks *cancel* event frequently so the scan can be aborted on timeout.
+    Depth-first over an explicit stack of directory iterators, visiting
+    entries in on-disk order.  With *workers* > 1 the walk is handed to
+    _traverse_directory_threaded() instead.  Each reported file's inode
+    is added to *found_inodes* so the orphan pass can skip it.  Polls
+    *cancel* every 64 entries so the scan can be aborted on timeout.
     """
-    if depth > 64 or cancel.is_set():
+    # Every directory path carries a trailing "/" from here on
+    if not path.endswith("/"):
+        path += "/"
+    if workers > 1:
+        _traverse_directory_threaded(
+            fs_info, directory, path, device_path, wanted_exts,
+            results, on_file_found, on_status,
+            visited_inodes, found_inodes, cancel, stats, workers,
+        )
         return
 
-    try:
-        for entry in directory:
-            # ── Check cancellation on every entry ──
-            if cancel.is_set():
-                return
-
-            entries_scanned[0] += 1
-
-            # Periodic progress update (every 500 entries)
-            if entries_scanned[0] % 500 == 0 and on_status:
-                on_status(
-                    f"🔍 TSK: Scanned {entries_scanned[0]:,} entries, "
-                    f"{dirs_visited[0]:,} dirs — "
-                    f"found {len(results)} deleted files..."
-                )
-
-            try:
-                name = entry.info.name.name
-                if isinstance(name, bytes):
-                    name = name.decode("utf-8", errors="replace")
-
-                # Skip . and .. and macOS AppleDouble resource fork files
-                if name in (".", "..", "$OrphanFiles"):
-                    continue
-                if name.startswith("._"):
-                    continue
-
-                # Get metadata
-                meta = entry.info.meta
-                if meta is None:
-                    continue
+    last_status = time.monotonic()
+    stack = [(iter(directory), path, 0)]
+    while stack:
+        entries, dir_path, depth = stack[-1]
+        try:
+            entry = next(entries, None)
+        except Exception as e:
+            logger.debug("TSK: Error traversing directory %s: %s", dir_path, e)
+            entry = None
+        if entry is None:
+            stack.pop()
+            continue
+
+        # ── Check cancellation every 64 entries ──
+        if not stats.entries & 63 and cancel.is_set():
+            return
+        stats.entries += 1
 
-                inode = meta.addr
-                if inode in visited_inodes:
-                    continue
-                visited_inodes.add(inode)
+        # Periodic progress update, rate-limited by wall clock so fast
+        # volumes don't flood the UI thread
+        if on_status and time.monotonic() - last_status >= _STATUS_INTERVAL:
+            last_status = time.monotonic()
+            on_status(
+                f"🔍 TSK: Scanned {stats.entries:,} entries, "
+                f"{stats.dirs:,} dirs — "
+                f"found {len(results)} deleted files..."
+            )
 
-                f_type = meta.type
+        try:
+            head = _entry_head(entry, wanted_exts)
+            if head is None:
+                continue
+            name, ext, name_flags, meta = head
+            if not visited_inodes.add(meta.addr):
+                continue
 
-                # Recurse into directories (including deleted ones)
-                if f_type == pytsk3.TSK_FS_META_TYPE_DIR:
-                    dirs_visited[0] += 1
+            # Descend into directories (including deleted ones)
+            if meta.type == _TYPE_DIR:
+                stats.dirs += 1
+                if depth < 64:
                     try:
-                        sub_dir = entry.as_directory()
-                        sub_path = f"{path}{name}/" if path.endswith("/") else f"{path}/{name}/"
-                        _traverse_directory(
-                            fs_info, sub_dir, sub_path, device_path,
-                            wanted_exts, results, on_file_found, on_status,
-                            visited_inodes, cancel, dirs_visited, entries_scanned,
-                            depth + 1,
-                        )
+                        stack.append((iter(entry.as_directory()),
+                                      f"{dir_path}{name}/", depth + 1))
                     except Exception:
                         pass
-                    continue
-
-                # Regular file — check if deleted
-                if f_type != pytsk3.TSK_FS_META_TYPE_REG:
-                    continue
-
-                is_deleted = bool(meta.flags & pytsk3.TSK_FS_META_FLAG_UNALLOC)
-                if not is_deleted:
-                    # Also check the name flags
-                    name_flags = entry.info.name.flags
-                    is_deleted = bool(name_flags & pytsk3.TSK_FS_NAME_FLAG_UNALLOC)
-
-                if not is_deleted:
-                    continue
-
-                # Check extension
-                ext = ""
-                if "." in name:
-                    ext = name.rsplit(".", 1)[-1].lower()
-                if ext not in wanted_exts:
-                    continue
-
-                # Get file size
-                file_size = meta.size
-                if file_size is None or file_size <= 0:
-                    continue
+                continue
 
-                # Skip very small files (< 1KB likely corrupt)
-                if file_size < 1024:
-                    continue
+            tsk_file = _deleted_file(fs_info, device_path, dir_path, name, ext,
+                                     name_flags, meta, wanted_exts)
+            if tsk_file is None:
+                continue
+            results.append(tsk_file)
+            found_inodes.add(tsk_file.inode)
+            if on_file_found:
+                on_file_found(tsk_file)
 
-                category = _ext_category(ext)
-                if not category:
-                    continue
+        except Exception as e:
+            # Skip problematic entries
+            logger.debug("TSK: Error processing entry: %s", e)
 
-                full_path = f"{path}{name}" if path.endswith("/") else f"{path}/{name}"
 
-                # Try to get deletion time
-                del_time = 0.0
-                try:
-                    if hasattr(meta, 'crtime') and meta.crtime:
-                        del_time = float(meta.crtime)
-                except Exception:
-                    pass
+def _traverse_directory_threaded(
+    fs_info,
+    directory,
+    path: str,
+    device_path: str,
+    wanted_exts: frozenset[str],
+    results: list[TSKDeletedFile],
+    on_file_found: Optional[Callable],
+    on_status: Optional[Callable],
+    visited_inodes: _InodeBitmap,
+    found_inodes: set[int],
+    cancel: threading.Event,
+    stats: _ScanStats,
+    workers: int,
+):
+    """_traverse_directory() on a pool of *workers* threads.
 
-                tsk_file = TSKDeletedFile(
-                    name=name,
-                    path=full_path,
-                    extension=ext,
-                    category=category,
-                    size=file_size,
-                    inode=inode,
-                    offset=_get_file_offset(fs_info, entry, meta),
-                    raw_device=device_path,
-                    deleted_time=del_time,
+    Each thread takes the newest directory from a shared LIFO (keeping the
+    walk close to depth-first for locality), lists it, and pushes its
+    subdirectories, so several metadata reads are in flight at once.
+    Result order is not deterministic.  *path* must end in "/".
+    """
+    lock = threading.Lock()
+    last_status = [time.monotonic()]
+
+    def visit(entry, path: str, depth: int):
+        """Process one entry; returns (entries, path, depth) to descend into."""
+        with lock:
+            stats.entries += 1
+            if on_status and time.monotonic() - last_status[0] >= _STATUS_INTERVAL:
+                last_status[0] = time.monotonic()
+                on_status(
+                    f"🔍 TSK: Scanned {stats.entries:,} entries, "
+                    f"{stats.dirs:,} dirs — "
+                    f"found {len(results)} deleted files..."
                 )
-                results.append(tsk_file)
 
-                if on_file_found:
-                    on_file_found(tsk_file)
+        try:
+            head = _entry_head(entry, wanted_exts)
+            if head is None:
+                return None
+            name, ext, name_flags, meta = head
+            with lock:
+                if not visited_inodes.add(meta.addr):
+                    return None
+                if meta.type == _TYPE_DIR:
+                    stats.dirs += 1
+
+            if meta.type == _TYPE_DIR:
+                if depth < 64:
+                    try:
+                        return iter(entry.as_directory()), f"{path}{name}/", depth + 1
+                    except Exception:
+                        pass
+                return None
 
-                logger.debug("TSK: Deleted file: %s (%d bytes, inode=%d)",
-                             full_path, file_size, inode)
+            tsk_file = _deleted_file(fs_info, device_path, path, name, ext,
+                                     name_flags, meta, wanted_exts)
+            if tsk_file is not None:
+                with lock:
+                    results.append(tsk_file)
+                    found_inodes.add(tsk_file.inode)
+                    if on_file_found:
+                        on_file_found(tsk_file)
 
+        except Exception as e:
+            logger.debug("TSK: Error processing entry: %s", e)
+        return None
+
+    # *busy* counts directories still being listed, which may yet add
+    # work — threads only exit once it drops to zero
+    pending = deque([(iter(directory), path, 0)])
+    busy = [0]
+    cond = threading.Condition()
+
+    def _walker():
+        while True:
+            with cond:
+                while not pending and busy[0] and not cancel.is_set():
+                    cond.wait(0.1)
+                if not pending or cancel.is_set():
+                    cond.notify_all()
+                    return
+                entries, dir_path, depth = pending.pop()
+                busy[0] += 1
+            subdirs = []
+            try:
+                for entry in entries:
+                    if not stats.entries & 63 and cancel.is_set():
+                        break
+                    sub = visit(entry, dir_path, depth)
+                    if sub is not None:
+                        subdirs.append(sub)
             except Exception as e:
-                # Skip problematic entries
-                logger.debug("TSK: Error processing entry: %s", e)
-                continue
+                logger.debug("TSK: Error traversing directory %s: %s", dir_path, e)
+            finally:
+                with cond:
+                    # Reversed so pop() hands them out in directory order
+                    pending.extend(reversed(subdirs))
+                    busy[0] -= 1
+                    cond.notify_all()
+
+    threads = [threading.Thread(target=_walker, daemon=True)
+               for _ in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def _entry_head(entry, wanted_exts: frozenset[str]):
+    """Cheap first look at a directory entry.
+
+    Returns (name, ext, name_flags, meta), or None if the entry can be
+    skipped before its inode is claimed.
+    """
+    # Each attribute hop builds a fresh wrapper — take them once
+    info = entry.info
+    name_obj = info.name
+    name = name_obj.name
+    if isinstance(name, bytes):
+        name = name.decode("utf-8", errors="replace")
+
+    # Skip . and .. and macOS AppleDouble resource fork files
+    if name in (".", "..", "$OrphanFiles"):
+        return None
+    if name.startswith("._"):
+        return None
+
+    # Check the extension before touching metadata — building the
+    # meta wrapper is the costly part, and most names won't match.
+    # Only names the directory itself calls regular files are
+    # dropped here; anything else may still be a directory.
+    dot = name.rfind(".")
+    ext = name[dot + 1:].lower() if dot >= 0 else ""
+    if ext not in wanted_exts and name_obj.type == _NAME_TYPE_REG:
+        return None
+
+    meta = info.meta
+    if meta is None:
+        return None
+    return name, ext, name_obj.flags, meta
+
+
+def _deleted_file(
+    fs_info,
+    device_path: str,
+    dir_path: str,
+    name: str,
+    ext: str,
+    name_flags: int,
+    meta,
+    wanted_exts: frozenset[str],
+) -> Optional[TSKDeletedFile]:
+    """Build the TSKDeletedFile for a wanted deleted regular file, else None."""
+    # Regular file — check if deleted
+    if meta.type != _TYPE_REG:
+        return None
+
+    is_deleted = bool(meta.flags & _FLAG_UNALLOC_META)
+    if not is_deleted:
+        # Also check the name flags
+        is_deleted = bool(name_flags & _FLAG_UNALLOC_NAME)
+
+    if not is_deleted:
+        return None
+
+    if ext not in wanted_exts:
+        return None
+
+    # Get file size
+    file_size = meta.size
+    if file_size is None or file_size <= 0:
+        return None
+
+    # Skip very small files (< 1KB likely corrupt)
+    if file_size < 1024:
+        return None
+
+    category = _ext_category(ext)
+    if not category:
+        return None
+
+    full_path = dir_path + name
+
+    # Try to get deletion time
+    del_time = 0.0
+    try:
+        crtime = getattr(meta, "crtime", None)
+        if crtime:
+            del_time = float(crtime)
+    except Exception:
+        pass
 
-    except Exception as e:
-        logger.debug("TSK: Error traversing directory %s: %s", path, e)
+    inode = meta.addr
+    logger.debug("TSK: Deleted file: %s (%d bytes, inode=%d)",
+                 full_path, file_size, inode)
+    return TSKDeletedFile(
+        name=name,
+        path=full_path,
+        extension=ext,
+        category=category,
+        size=file_size,
+        inode=inode,
+        offset=_get_file_offset(fs_info, meta),
+        raw_device=device_path,
+        deleted_time=del_time,
+    )
 
 
 def _find_orphan_files(
     fs_info,
     device_path: str,
-    wanted_exts: set[str],
+    wanted_exts: frozenset[str],
     results: list[TSKDeletedFile],
     on_file_found: Optional[Callable],
     cancel: threading.Event,
@@ -501,7 +880,8 @@ def _find_orphan_files(
             if cancel.is_set():
                 return
             try:
-                meta = entry.info.meta
+                info = entry.info
+                meta = info.meta
                 if meta is None:
                     continue
 
@@ -509,16 +889,15 @@ def _find_orphan_files(
                 if inode in existing_inodes:
                     continue
 
-                if meta.type != pytsk3.TSK_FS_META_TYPE_REG:
+                if meta.type != _TYPE_REG:
                     continue
 
-                name = entry.info.name.name
+                name = info.name.name
                 if isinstance(name, bytes):
                     name = name.decode("utf-8", errors="replace")
 
-                ext = ""
-                if "." in name:
-                    ext = name.rsplit(".", 1)[-1].lower()
+                dot = name.rfind(".")
+                ext = name[dot + 1:].lower() if dot >= 0 else ""
                 if ext not in wanted_exts:
                     continue
 
@@ -537,7 +916,7 @@ def _find_orphan_files(
                     category=category,
                     size=file_size,
                     inode=inode,
-                    offset=_get_file_offset(fs_info, entry, meta),
+                    offset=_get_file_offset(fs_info, meta),
                     raw_device=device_path,
                 )
                 results.append(tsk_file)
@@ -554,23 +933,18 @@ def _find_orphan_files(
             logger.debug("TSK: Orphan scan error: %s", e)
 
 
-def _get_file_offset(fs_info, entry, meta) -> int:
+def _get_file_offset(fs_info, meta) -> int:
     """Get the byte offset of the first data block/cluster on disk."""
     try:
-        # Open the file to get its data runs
-        if hasattr(entry, 'info') and hasattr(entry.info, 'name'):
-            inode = meta.addr
-            f = fs_info.open_meta(inode)
-            # Read first byte to trigger data run resolution
-            # The offset is: block_address * block_size
-            for attr in f:
-                if hasattr(attr, 'info') and attr.info.type in (
-                    pytsk3.TSK_FS_ATTR_TYPE_DEFAULT,
-                    pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA,
-                ):
-                    for run in attr:
-                        if run.addr > 0:
-                            return run.addr * fs_info.info.block_size
+        # pytsk3 only exposes attributes and runs as iterators, so walk the
+        # data attributes and stop at the first allocated run.  The offset
+        # is: block_address * block_size
+        for attr in fs_info.open_meta(meta.addr):
+            attr_info = getattr(attr, "info", None)
+            if attr_info is not None and attr_info.type in _DATA_ATTR_TYPES:
+                for run in attr:
+                    if run.addr > 0:
+                        return run.addr * fs_info.info.block_size
     except Exception:
         pass
     return 0
@@ -580,29 +954,91 @@ def _get_fs_type_name(fs_info) -> str:
     """Get a human-readable filesystem type name."""
     try:
         fs_type = fs_info.info.ftype
-        _FS_NAMES = {
-            pytsk3.TSK_FS_TYPE_NTFS: "NTFS",
-            pytsk3.TSK_FS_TYPE_FAT12: "FAT12",
-            pytsk3.TSK_FS_TYPE_FAT16: "FAT16",
-            pytsk3.TSK_FS_TYPE_FAT32: "FAT32",
-            pytsk3.TSK_FS_TYPE_EXFAT: "exFAT",
-            pytsk3.TSK_FS_TYPE_HFS: "HFS+",
-            pytsk3.TSK_FS_TYPE_EXT2: "ext2",
-            pytsk3.TSK_FS_TYPE_EXT3: "ext3",
-            pytsk3.TSK_FS_TYPE_EXT4: "ext4",
-            pytsk3.TSK_FS_TYPE_ISO9660: "ISO9660",
-            pytsk3.TSK_FS_TYPE_FFS1: "UFS1",
-            pytsk3.TSK_FS_TYPE_FFS2: "UFS2",
-        }
         return _FS_NAMES.get(fs_type, f"Unknown ({fs_type})")
     except Exception:
         return "Unknown"
 
 
+# device path → (img_info, fs_info), kept open across save_tsk_file calls
+# so each saved file doesn't re-parse the boot sector / MFT header
+_FS_CACHE: dict[str, tuple] = {}
+_FS_CACHE_LOCK = threading.Lock()
+
+
+def _open_fs_cached(device_path: str) -> tuple:
+    """Open (or reuse) the image and filesystem handles for a device."""
+    with _FS_CACHE_LOCK:
+        cached = _FS_CACHE.get(device_path)
+        if cached is None:
+            try:
+                img_info = pytsk3.Img_Info(device_path)
+            except Exception:
+                img_info = RawDeviceImgInfo(device_path)
+            cached = (img_info, pytsk3.FS_Info(img_info))
+            _FS_CACHE[device_path] = cached
+    return cached
+
+
+def close_tsk_cache():
+    """Release the filesystem handles cached by save_tsk_file()."""
+    with _FS_CACHE_LOCK:
+        handles = list(_FS_CACHE.values())
+        _FS_CACHE.clear()
+    for img_info, _ in handles:
+        try:
+            img_info.close()
+        except Exception:
+            pass
+
+
+# Post-save decode checks deferred by save_tsk_file(pending=...)
+_VALIDATE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tsk-validate")
+
+
+def _post_validate(output_path: str, extension: str) -> bool:
+    """Check a saved file decodes; removes it and returns False if not."""
+    from .smart_filter import validate_carved_file
+
+    # For image files, try Pillow validation on the saved file
+    try:
+        actual_size = os.path.getsize(output_path)
+        with open(output_path, "rb") as f:
+            saved_data = f.read(min(actual_size, 10 * 1024 * 1024))
+        if not validate_carved_file(extension, saved_data):
+            logger.warning("TSK: Saved file failed validation: %s (removing)",
+                          output_path)
+            os.remove(output_path)
+            return False
+    except Exception:
+        pass  # If validation itself fails, keep the file
+    return True
+
+
+def drain_validations(
+    pending: list[tuple[str, Future]],
+    wait: bool = True,
+) -> list[tuple[str, bool]]:
+    """Collect finished deferred validations from *pending*.
+
+    Removes them from the list and returns (output_path, passed) pairs in
+    submission order; with *wait* it blocks until all of them are done.
+    Files that failed are already removed.
+    """
+    finished, still_pending = [], []
+    for path, fut in pending:
+        if wait or fut.done():
+            finished.append((path, fut.result()))
+        else:
+            still_pending.append((path, fut))
+    pending[:] = still_pending
+    return finished
+
+
 def save_tsk_file(
     fs_info_or_device: str,
     tsk_file: TSKDeletedFile,
     output_path: str,
+    pending: Optional[list[tuple[str, Future]]] = None,
 ) -> bool:
     """
     Save a TSK-recovered file by reading its data blocks from the device.
@@ -613,20 +1049,20 @@ def save_tsk_file(
     Validates data matches expected format before saving — on exFAT and
     FAT32 deleted file clusters are often quickly reallocated, so the data
     may be overwritten with unrelated content.
+
+    Given a *pending* list, the post-save decode check runs on a worker
+    pool instead: (output_path, future) is appended and True is returned
+    once the data is written.  Pass the list to drain_validations() to
+    learn which files passed.
     """
     if not HAS_TSK:
         return False
 
     try:
-        from .smart_filter import validate_file_data_matches_extension, validate_carved_file
+        from .smart_filter import validate_file_data_matches_extension
 
-        # Open device and filesystem
-        try:
-            img_info = pytsk3.Img_Info(tsk_file.raw_device)
-        except Exception:
-            img_info = RawDeviceImgInfo(tsk_file.raw_device)
-
-        fs_info = pytsk3.FS_Info(img_info)
+        # Open device and filesystem (shared across a save session)
+        _, fs_info = _open_fs_cached(tsk_file.raw_device)
 
         # Open the file by inode
         file_entry = fs_info.open_meta(tsk_file.inode)
@@ -657,22 +1093,30 @@ def save_tsk_file(
         if out_dir:
             os.makedirs(out_dir, exist_ok=True)
 
-        # Read and write in chunks
-        with open(output_path, "wb") as f:
-            offset = 0
-            chunk_size = 1024 * 1024  # 1MB chunks
+        # Read and write in chunks, straight to the fd (no Python buffering)
+        fd = os.open(output_path,
+                     os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+                     0o666)
+        try:
             file_size = tsk_file.size
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
 
+            offset = 0
             while offset < file_size:
-                to_read = min(chunk_size, file_size - offset)
+                to_read = min(_SAVE_CHUNK, file_size - offset)
                 try:
                     data = file_entry.read_random(offset, to_read)
                 except Exception:
                     break
                 if not data:
                     break
-                f.write(data)
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
                 offset += len(data)
+        finally:
+            os.close(fd)
 
         # Post-save validation: verify the saved file is actually valid
         actual_size = os.path.getsize(output_path)
@@ -682,17 +1126,11 @@ def save_tsk_file(
             os.remove(output_path)
             return False
 
-        # For image files, try Pillow validation on the saved file
-        try:
-            with open(output_path, "rb") as f:
-                saved_data = f.read(min(actual_size, 10 * 1024 * 1024))
-            if not validate_carved_file(tsk_file.extension, saved_data):
-                logger.warning("TSK: Saved file failed validation: %s (removing)",
-                              output_path)
-                os.remove(output_path)
-                return False
-        except Exception:
-            pass  # If validation itself fails, keep the file
+        if pending is not None:
+            pending.append((output_path, _VALIDATE_POOL.submit(
+                _post_validate, output_path, tsk_file.extension)))
+        elif not _post_validate(output_path, tsk_file.extension):
+            return False
 
         logger.info("TSK: Saved %s (%d bytes) -> %s",
                     tsk_file.name, tsk_file.size, output_path)
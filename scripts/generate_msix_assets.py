@@ -23,10 +23,19 @@ Scale variants (recommended for HiDPI screens):
 Usage:
     python scripts/generate_msix_assets.py
     python scripts/generate_msix_assets.py path/to/source.png
+    python scripts/generate_msix_assets.py --force    # regenerate everything
+
+Assets whose files are all newer than the source image (and this script)
+are skipped; use --force to rebuild them anyway.
 """
 
 import os
+import platform
+import shutil
+import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 
 # ── Paths ──────────────────────────────────────────────────────
 SCRIPT_DIR  = os.path.dirname(os.path.abspath(__file__))
@@ -34,6 +43,11 @@ PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
 ASSETS_DIR  = os.path.join(PROJECT_DIR, "msix", "Assets")
 SOURCE_PNG  = os.path.join(PROJECT_DIR, "assets", "icon.png")
 
+# PNG encoding: when oxipng is on PATH, Pillow writes with fast zlib and a
+# single oxipng pass shrinks everything afterwards (smaller and quicker than
+# Pillow's optimize=True); otherwise fall back to optimize=True
+OXIPNG_ARGS = ["-o", "4", "--strip", "safe", "--quiet"]
+
 # ── Asset specifications ────────────────────────────────────────
 # (filename_stem, width, height, background_color_or_None)
 ASSETS = [
@@ -56,14 +70,201 @@ SCALES = [
 ]
 
 
-def generate_assets(source_path: str) -> None:
-    """Generate all MSIX assets from a source PNG."""
+def _icon_size(stem: str, w: int, h: int) -> int:
+    """Side of the square box the icon is fitted into on a w×h canvas."""
+    if stem == "SplashScreen":
+        return int(min(w, h) * 0.55)
+    if stem == "Wide310x150Logo":
+        return int(h * 0.80)
+    padding_pct = 0.10
+    return int(min(w, h) * (1.0 - 2 * padding_pct))
+
+
+def _render_asset(shm_name: str, src_size: tuple[int, int], assets_dir: str,
+                  save_opts: dict, stem: str, base_w: int, base_h: int,
+                  bg_color) -> tuple[list[str], list[str]]:
+    """Render every scale of one asset; returns (progress lines, paths).
+
+    Runs in a worker process. The parent decodes the source once into
+    shared memory; the worker wraps those pixels without copying.
+    """
+    from PIL import Image
+
+    shm = shared_memory.SharedMemory(name=shm_name)
     try:
-        from PIL import Image
-    except ImportError:
-        print("❌  Pillow is required. Install with: pip install Pillow")
-        sys.exit(1)
+        # The Image must be gone before close() — pass it straight through
+        # so no frame here keeps a reference
+        return _render_from(
+            Image.frombuffer("RGBA", src_size, shm.buf, "raw", "RGBA", 0, 1),
+            assets_dir, save_opts, stem, base_w, base_h, bg_color,
+        )
+    finally:
+        try:
+            shm.close()
+        except BufferError:
+            # Still referenced from an exception traceback; freed at exit
+            pass
+
+
+# Per-worker canvases by (w, h, fill): sizes repeat across assets (e.g. 88×88
+# is both Square44 @200% and Square71 @125%), so refill instead of allocating
+_CANVAS_CACHE: dict[tuple, object] = {}
+
+
+def _blank_canvas(w: int, h: int, fill: tuple):
+    """Return a w×h RGBA canvas filled with *fill*, reusing a cached one."""
+    from PIL import Image
+
+    key = (w, h, fill)
+    canvas = _CANVAS_CACHE.get(key)
+    if canvas is None:
+        canvas = _CANVAS_CACHE[key] = Image.new("RGBA", (w, h), fill)
+    else:
+        canvas.paste(fill, (0, 0, w, h))
+    return canvas
+
+
+def _render_from(src, assets_dir: str, save_opts: dict, stem: str,
+                 base_w: int, base_h: int,
+                 bg_color) -> tuple[list[str], list[str]]:
+    """Render every scale of one asset from the decoded RGBA source."""
+    from PIL import Image
+
+    def fit(img, box: int):
+        """Scale *img* down into a box×box square, as thumbnail() would but
+        returning a new image instead of copying and shrinking in place."""
+        ratio = min(box / img.width, box / img.height)
+        if ratio >= 1.0:
+            return img
+        size = (max(1, round(img.width * ratio)), max(1, round(img.height * ratio)))
+
+        # Box-filter by the largest power of two that stays >= 2× the
+        # target, so Lanczos only does the last step. Done by hand because
+        # resize() ignores reducing_gap for RGBA; premultiplied like
+        # resize() so transparent pixels don't bleed into the edges.
+        factor = 1
+        while (img.width // (factor * 2) >= size[0] * 2
+               and img.height // (factor * 2) >= size[1] * 2):
+            factor *= 2
+        if factor > 1:
+            img = img.convert("RGBa").reduce(factor).convert("RGBA")
+        return img.resize(size, Image.LANCZOS)
+
+    def to_palette(canvas):
+        """Exact 8-bit palette copy of *canvas*, or None if it has more
+        than 256 colours."""
+        colors = canvas.getcolors(256)
+        if colors is None:
+            return None
+        palette = bytearray()
+        index = {}
+        for i, (_, rgba) in enumerate(colors):
+            palette += bytes(rgba)
+            index[int.from_bytes(bytes(rgba), sys.byteorder)] = i
+        # One native uint32 per RGBA pixel; map() keeps the lookup in C
+        pixels = memoryview(canvas.tobytes()).cast("I")
+        pal = Image.frombytes("P", canvas.size, bytes(map(index.__getitem__, pixels)))
+        pal.putpalette(palette, "RGBA")
+        return pal
+
+    # Downscale the (large) source once to the biggest size this asset
+    # needs; the other scales are derived from that much smaller image
+    max_icon = max(
+        _icon_size(stem, int(base_w * scale_factor), int(base_h * scale_factor))
+        for scale_factor, _ in SCALES
+    )
+    base_icon = fit(src, max_icon)
+
+    lines, paths = [], []
+    for scale_factor, scale_label in SCALES:
+        w = int(base_w * scale_factor)
+        h = int(base_h * scale_factor)
+
+        # Create canvas
+        canvas = _blank_canvas(w, h, bg_color or (0, 0, 0, 0))
+
+        icon = fit(base_icon, _icon_size(stem, w, h))
+
+        if stem == "SplashScreen":
+            # Splash: center the icon at ~40% height, scale to fit nicely
+            offset_x = (w - icon.width) // 2
+            offset_y = (h - icon.height) // 2
+            canvas.paste(icon, (offset_x, offset_y), icon)
+        elif stem == "Wide310x150Logo":
+            # Wide tile: icon on left, padded
+            padding = int(h * 0.10)
+            canvas.paste(icon, (padding, (h - icon.height) // 2), icon)
+        else:
+            # Square tiles: icon centered with padding
+            offset_x = (w - icon.width) // 2
+            offset_y = (h - icon.height) // 2
+            canvas.paste(icon, (offset_x, offset_y), icon)
+
+        # Flat tile artwork often fits a 256-colour palette: 1 byte per
+        # pixel instead of 4. The splash (solid background) stays RGBA.
+        if stem != "SplashScreen":
+            canvas = to_palette(canvas) or canvas
+
+        # Save the scaled name; the bare name for scale-100 is linked to it
+        # by the parent once all encoding (and oxipng) is done
+        out_path = os.path.join(assets_dir, f"{stem}.{scale_label}.png")
+        canvas.save(out_path, "PNG", **save_opts)
+        paths.append(out_path)
 
+        if scale_label == "scale-100":
+            lines.append(f"   ✅  {stem}.png ({w}×{h})  +  {scale_label}")
+        else:
+            lines.append(f"       {stem}.{scale_label}.png ({w}×{h})")
+    return lines, paths
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link *dst* to *src*, copying instead where links aren't supported."""
+    try:
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except (OSError, NotImplementedError):
+        shutil.copyfile(src, dst)
+
+
+def _asset_paths(assets_dir: str, stem: str) -> list[str]:
+    """All files generated for one asset (every scale + the bare name)."""
+    paths = [os.path.join(assets_dir, f"{stem}.{label}.png") for _, label in SCALES]
+    paths.append(os.path.join(assets_dir, f"{stem}.png"))
+    return paths
+
+
+def _asset_is_current(assets_dir: str, stem: str, stamp: float) -> bool:
+    """True if every file of the asset exists, is non-empty and newer than *stamp*."""
+    for path in _asset_paths(assets_dir, stem):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if st.st_size == 0 or st.st_mtime < stamp:
+            return False
+    return True
+
+
+def _is_pillow_simd(version: str) -> bool:
+    """True if the installed Pillow is Pillow-SIMD, or SIMD doesn't apply.
+
+    Pillow-SIMD is an x86-only drop-in fork; its releases carry a
+    ``.postN`` suffix (e.g. ``9.0.0.post1``) that stock Pillow never uses.
+    """
+    if platform.machine().lower() not in ("x86_64", "amd64", "i386", "i686", "x86"):
+        return True
+    return "post" in version or "simd" in version.lower()
+
+
+def generate_assets(source_path: str, force: bool = False) -> None:
+    """Generate all MSIX assets from a source PNG.
+
+    Assets that are already up to date are skipped unless *force* is set.
+    """
     if not os.path.exists(source_path):
         print(f"❌  Source image not found: {source_path}")
         print("    Run: python assets/generate_icons.py   to create icon.png first.")
@@ -74,70 +275,93 @@ def generate_assets(source_path: str) -> None:
     print(f"🖼   Source image:     {source_path}")
     print()
 
+    # Outputs depend on the source and on the rendering code in this file
+    stamp = max(os.path.getmtime(source_path), os.path.getmtime(__file__))
+    todo = []
+    for asset in ASSETS:
+        if not force and _asset_is_current(ASSETS_DIR, asset[0], stamp):
+            print(f"   ⏭   {asset[0]} — up to date")
+        else:
+            todo.append(asset)
+    if not todo:
+        print()
+        print(f"✅  All {len(ASSETS)} assets are up to date (use --force to regenerate)")
+        print(f"    in: {ASSETS_DIR}")
+        return
+
+    # Pillow is only imported once there is something to render, so
+    # up-to-date reruns never pay for it
+    try:
+        import PIL
+        from PIL import Image
+    except ImportError:
+        print("❌  Pillow is required. Install with: pip install Pillow")
+        sys.exit(1)
+    if not _is_pillow_simd(PIL.__version__):
+        print("💡  Tip: Pillow-SIMD resizes several times faster on x86 — see BUILD.md.")
+
+    oxipng = shutil.which("oxipng")
+    save_opts = {"compress_level": 1} if oxipng else {"optimize": True}
+
+    # Decode the source once; workers read the pixels from shared memory
     src = Image.open(source_path).convert("RGBA")
+    pixels = src.tobytes()
+    shm = shared_memory.SharedMemory(create=True, size=len(pixels))
+    try:
+        shm.buf[:len(pixels)] = pixels
+        del pixels
+
+        # Assets are independent (Lanczos resize and PNG encode are both
+        # CPU-bound) — render them in parallel, print in the usual order
+        workers = min(len(todo), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_render_asset, shm.name, src.size, ASSETS_DIR,
+                            save_opts, *asset)
+                for asset in todo
+            ]
+            all_paths = []
+            for fut in futures:
+                lines, paths = fut.result()
+                for line in lines:
+                    print(line)
+                all_paths.extend(paths)
+    finally:
+        shm.close()
+        shm.unlink()
+
+    if oxipng:
+        print()
+        print(f"🗜   Optimising {len(all_paths)} files with oxipng ...")
+        result = subprocess.run([oxipng, *OXIPNG_ARGS, *all_paths])
+        if result.returncode != 0:
+            # The files are still valid PNGs, just not minimised
+            print("⚠️   oxipng failed — assets were left with fast zlib compression.")
 
-    for stem, base_w, base_h, bg_color in ASSETS:
-        for scale_factor, scale_label in SCALES:
-            w = int(base_w * scale_factor)
-            h = int(base_h * scale_factor)
-
-            # Create canvas
-            if bg_color:
-                canvas = Image.new("RGBA", (w, h), bg_color)
-            else:
-                canvas = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-
-            if stem == "SplashScreen":
-                # Splash: center the icon at ~40% height, scale to fit nicely
-                icon_size = int(min(w, h) * 0.55)
-                icon = src.copy()
-                icon.thumbnail((icon_size, icon_size), Image.LANCZOS)
-                offset_x = (w - icon.width) // 2
-                offset_y = (h - icon.height) // 2
-                canvas.paste(icon, (offset_x, offset_y), icon)
-            elif stem == "Wide310x150Logo":
-                # Wide tile: icon on left, padded
-                icon_size = int(h * 0.80)
-                icon = src.copy()
-                icon.thumbnail((icon_size, icon_size), Image.LANCZOS)
-                padding = int(h * 0.10)
-                canvas.paste(icon, (padding, (h - icon.height) // 2), icon)
-            else:
-                # Square tiles: icon centered with padding
-                padding_pct = 0.10
-                icon_size = int(min(w, h) * (1.0 - 2 * padding_pct))
-                icon = src.copy()
-                icon.thumbnail((icon_size, icon_size), Image.LANCZOS)
-                offset_x = (w - icon.width) // 2
-                offset_y = (h - icon.height) // 2
-                canvas.paste(icon, (offset_x, offset_y), icon)
-
-            # Save base (scale-100) as both bare name and scaled name
-            out_path = os.path.join(ASSETS_DIR, f"{stem}.{scale_label}.png")
-            canvas.save(out_path, "PNG", optimize=True)
-
-            # Also save as bare filename for the scale-100 variant
-            if scale_label == "scale-100":
-                bare_path = os.path.join(ASSETS_DIR, f"{stem}.png")
-                canvas.save(bare_path, "PNG", optimize=True)
-                print(f"   ✅  {stem}.png ({w}×{h})  +  {scale_label}")
-            else:
-                print(f"       {stem}.{scale_label}.png ({w}×{h})")
+    # Bare filename for the scale-100 variant — identical bytes, so link
+    # (or copy) rather than encoding the same canvas twice
+    for stem, *_ in todo:
+        _link_or_copy(
+            os.path.join(ASSETS_DIR, f"{stem}.scale-100.png"),
+            os.path.join(ASSETS_DIR, f"{stem}.png"),
+        )
 
     print()
-    print(f"✅  Generated {len(ASSETS)} assets ({len(ASSETS) * len(SCALES)} files total)")
+    print(f"✅  Generated {len(todo)} assets ({len(todo) * len(SCALES)} files total)")
     print(f"    in: {ASSETS_DIR}")
 
 
 def main():
-    source = sys.argv[1] if len(sys.argv) > 1 else SOURCE_PNG
+    args = sys.argv[1:]
+    force = "--force" in args
+    args = [a for a in args if a != "--force"]
+    source = args[0] if args else SOURCE_PNG
 
     # If source doesn't exist, try to generate it
     if not os.path.exists(source):
         gen_script = os.path.join(PROJECT_DIR, "assets", "generate_icons.py")
         if os.path.exists(gen_script):
             print(f"🎨  icon.png not found. Generating from assets/generate_icons.py ...")
-            import subprocess
             result = subprocess.run(
                 [sys.executable, gen_script],
                 cwd=PROJECT_DIR
@@ -149,7 +373,7 @@ def main():
             print(f"❌  Source image not found: {source}")
             sys.exit(1)
 
-    generate_assets(source)
+    generate_assets(source, force=force)
 
 
 if __name__ == "__main__":
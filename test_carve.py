@@ -1,127 +1,134 @@
 """
 Test the scanner against a synthetic disk image with embedded file signatures.
 This proves the scanner can actually find and carve files.
-Also tests: mmap reader, empty block skipping, TRIM detection.
+Also tests: mmap reader, empty block skipping, header search, OOXML type
+matching, TRIM detection.
 """
+import io
 import os
+import random
 import struct
 import tempfile
 import shutil
+import zipfile
 
 from recovery.scanner import DiskScanner
-from recovery.signatures import FTYP_BRANDS
+from recovery.signatures import FTYP_BRANDS, HEADER_SIGNATURES, find_all_headers
 from recovery.mmap_reader import DiskReader, is_empty_block, align_down, align_up
 from recovery.trim_detect import detect_drive_health, DriveHealthInfo
+from recovery.smart_filter import validate_file_data_matches_extension
 
 def build_test_image(path):
     """Create a ~10 MB disk image with embedded test files."""
+    buf = bytearray()
+    # Padding (simulates filesystem metadata / allocated space)
+    buf += b"\x00" * 512 * 100  # 50 KB of zeros
+
+    # ── Embedded JPEG at offset ~51200 ──
+    jpeg_offset = len(buf)
+    # Real JPEG structure: SOI + APP0 marker + content + EOI
+    buf += b"\xFF\xD8\xFF\xE0"           # SOI + APP0
+    buf += b"\x00\x10"                    # APP0 length
+    buf += b"JFIF\x00\x01\x01\x00"       # JFIF header
+    buf += b"\x00\x01\x00\x01\x00\x00"   # Density
+    # Fill with pseudo-random compressed data (high entropy)
+    random.seed(42)
+    jpeg_body = random.randbytes(20000)
+    buf += jpeg_body
+    buf += b"\xFF\xD9"                    # EOI marker
+    jpeg_end = len(buf)
+    jpeg_size = jpeg_end - jpeg_offset
+    print(f"  JPEG at offset {jpeg_offset} ({jpeg_size} bytes)")
+
+    # More padding
+    buf += b"\xAA" * 512 * 50
+
+    # ── Embedded PNG at current offset ──
+    png_offset = len(buf)
+    # PNG magic
+    buf += b"\x89PNG\r\n\x1A\n"
+    # IHDR chunk
+    ihdr_data = struct.pack(">IIBBBBB", 100, 100, 8, 2, 0, 0, 0)  # 100x100, 8bit RGB
+    ihdr_crc = b"\x00\x00\x00\x00"  # Fake CRC
+    buf += struct.pack(">I", len(ihdr_data))  # chunk length
+    buf += b"IHDR"
+    buf += ihdr_data
+    buf += ihdr_crc
+    # IDAT chunk with pseudo data
+    idat_body = random.randbytes(15000)
+    buf += struct.pack(">I", len(idat_body))
+    buf += b"IDAT"
+    buf += idat_body
+    buf += b"\x00\x00\x00\x00"  # Fake CRC
+    # IEND chunk
+    buf += b"\x00\x00\x00\x00"  # length 0
+    buf += b"IEND\xAE\x42\x60\x82"
+    png_end = len(buf)
+    png_size = png_end - png_offset
+    print(f"  PNG  at offset {png_offset} ({png_size} bytes)")
+
+    # More padding
+    buf += b"\xBB" * 512 * 30
+
+    # ── Embedded MP4 (ISO Base Media) ──
+    mp4_offset = len(buf)
+    # ftyp box: size=20, type=ftyp, brand=isom, minor_version=0
+    ftyp_data = b"isom" + b"\x00\x00\x00\x00"  # brand + minor version
+    ftyp_box = struct.pack(">I", 8 + len(ftyp_data)) + b"ftyp" + ftyp_data
+    buf += ftyp_box
+    # mdat box with fake video data
+    mdat_body = random.randbytes(25000)
+    mdat_box = struct.pack(">I", 8 + len(mdat_body)) + b"mdat" + mdat_body
+    buf += mdat_box
+    # moov box (minimal)
+    moov_body = b"\x00" * 100
+    moov_box = struct.pack(">I", 8 + len(moov_body)) + b"moov" + moov_body
+    buf += moov_box
+    mp4_end = len(buf)
+    mp4_size = mp4_end - mp4_offset
+    print(f"  MP4  at offset {mp4_offset} ({mp4_size} bytes)")
+
+    # More padding
+    buf += b"\xCC" * 512 * 20
+
+    # ── Embedded HEIC ──
+    heic_offset = len(buf)
+    ftyp_data = b"heic" + b"\x00\x00\x00\x00"
+    ftyp_box = struct.pack(">I", 8 + len(ftyp_data)) + b"ftyp" + ftyp_data
+    buf += ftyp_box
+    mdat_body = random.randbytes(18000)
+    mdat_box = struct.pack(">I", 8 + len(mdat_body)) + b"mdat" + mdat_body
+    buf += mdat_box
+    meta_body = b"\x00" * 80
+    meta_box = struct.pack(">I", 8 + len(meta_body)) + b"meta" + meta_body
+    buf += meta_box
+    heic_end = len(buf)
+    heic_size = heic_end - heic_offset
+    print(f"  HEIC at offset {heic_offset} ({heic_size} bytes)")
+
+    # ── Embedded MOV (QuickTime) ──
+    buf += b"\xDD" * 512 * 10
+    mov_offset = len(buf)
+    ftyp_data = b"qt  " + b"\x00\x00\x00\x00"
+    ftyp_box = struct.pack(">I", 8 + len(ftyp_data)) + b"ftyp" + ftyp_data
+    buf += ftyp_box
+    mdat_body = random.randbytes(22000)
+    mdat_box = struct.pack(">I", 8 + len(mdat_body)) + b"mdat" + mdat_body
+    buf += mdat_box
+    moov_body = b"\x00" * 100
+    moov_box = struct.pack(">I", 8 + len(moov_body)) + b"moov" + moov_body
+    buf += moov_box
+    mov_end = len(buf)
+    mov_size = mov_end - mov_offset
+    print(f"  MOV  at offset {mov_offset} ({mov_size} bytes)")
+
+    # Final padding to round up
+    buf += b"\x00" * 512 * 50
+    total = len(buf)
+    print(f"  Total image size: {total} bytes ({total / 1024:.1f} KB)")
+
     with open(path, "wb") as f:
-        # Padding (simulates filesystem metadata / allocated space)
-        f.write(b"\x00" * 512 * 100)  # 50 KB of zeros
-
-        # ── Embedded JPEG at offset ~51200 ──
-        jpeg_offset = f.tell()
-        # Real JPEG structure: SOI + APP0 marker + content + EOI
-        f.write(b"\xFF\xD8\xFF\xE0")           # SOI + APP0
-        f.write(b"\x00\x10")                    # APP0 length
-        f.write(b"JFIF\x00\x01\x01\x00")       # JFIF header
-        f.write(b"\x00\x01\x00\x01\x00\x00")   # Density
-        # Fill with pseudo-random compressed data (high entropy)
-        import random
-        random.seed(42)
-        jpeg_body = bytes(random.randint(0, 255) for _ in range(20000))
-        f.write(jpeg_body)
-        f.write(b"\xFF\xD9")                    # EOI marker
-        jpeg_end = f.tell()
-        jpeg_size = jpeg_end - jpeg_offset
-        print(f"  JPEG at offset {jpeg_offset} ({jpeg_size} bytes)")
-
-        # More padding
-        f.write(b"\xAA" * 512 * 50)
-
-        # ── Embedded PNG at current offset ──
-        png_offset = f.tell()
-        # PNG magic
-        f.write(b"\x89PNG\r\n\x1A\n")
-        # IHDR chunk
-        ihdr_data = struct.pack(">IIBBBBB", 100, 100, 8, 2, 0, 0, 0)  # 100x100, 8bit RGB
-        ihdr_crc = b"\x00\x00\x00\x00"  # Fake CRC
-        f.write(struct.pack(">I", len(ihdr_data)))  # chunk length
-        f.write(b"IHDR")
-        f.write(ihdr_data)
-        f.write(ihdr_crc)
-        # IDAT chunk with pseudo data
-        idat_body = bytes(random.randint(0, 255) for _ in range(15000))
-        f.write(struct.pack(">I", len(idat_body)))
-        f.write(b"IDAT")
-        f.write(idat_body)
-        f.write(b"\x00\x00\x00\x00")  # Fake CRC
-        # IEND chunk
-        f.write(b"\x00\x00\x00\x00")  # length 0
-        f.write(b"IEND\xAE\x42\x60\x82")
-        png_end = f.tell()
-        png_size = png_end - png_offset
-        print(f"  PNG  at offset {png_offset} ({png_size} bytes)")
-
-        # More padding
-        f.write(b"\xBB" * 512 * 30)
-
-        # ── Embedded MP4 (ISO Base Media) ──
-        mp4_offset = f.tell()
-        # ftyp box: size=20, type=ftyp, brand=isom, minor_version=0
-        ftyp_data = b"isom" + b"\x00\x00\x00\x00"  # brand + minor version
-        ftyp_box = struct.pack(">I", 8 + len(ftyp_data)) + b"ftyp" + ftyp_data
-        f.write(ftyp_box)
-        # mdat box with fake video data
-        mdat_body = bytes(random.randint(0, 255) for _ in range(25000))
-        mdat_box = struct.pack(">I", 8 + len(mdat_body)) + b"mdat" + mdat_body
-        f.write(mdat_box)
-        # moov box (minimal)
-        moov_body = b"\x00" * 100
-        moov_box = struct.pack(">I", 8 + len(moov_body)) + b"moov" + moov_body
-        f.write(moov_box)
-        mp4_end = f.tell()
-        mp4_size = mp4_end - mp4_offset
-        print(f"  MP4  at offset {mp4_offset} ({mp4_size} bytes)")
-
-        # More padding
-        f.write(b"\xCC" * 512 * 20)
-
-        # ── Embedded HEIC ──
-        heic_offset = f.tell()
-        ftyp_data = b"heic" + b"\x00\x00\x00\x00"
-        ftyp_box = struct.pack(">I", 8 + len(ftyp_data)) + b"ftyp" + ftyp_data
-        f.write(ftyp_box)
-        mdat_body = bytes(random.randint(0, 255) for _ in range(18000))
-        mdat_box = struct.pack(">I", 8 + len(mdat_body)) + b"mdat" + mdat_body
-        f.write(mdat_box)
-        meta_body = b"\x00" * 80
-        meta_box = struct.pack(">I", 8 + len(meta_body)) + b"meta" + meta_body
-        f.write(meta_box)
-        heic_end = f.tell()
-        heic_size = heic_end - heic_offset
-        print(f"  HEIC at offset {heic_offset} ({heic_size} bytes)")
-
-        # ── Embedded MOV (QuickTime) ──
-        f.write(b"\xDD" * 512 * 10)
-        mov_offset = f.tell()
-        ftyp_data = b"qt  " + b"\x00\x00\x00\x00"
-        ftyp_box = struct.pack(">I", 8 + len(ftyp_data)) + b"ftyp" + ftyp_data
-        f.write(ftyp_box)
-        mdat_body = bytes(random.randint(0, 255) for _ in range(22000))
-        mdat_box = struct.pack(">I", 8 + len(mdat_body)) + b"mdat" + mdat_body
-        f.write(mdat_box)
-        moov_body = b"\x00" * 100
-        moov_box = struct.pack(">I", 8 + len(moov_body)) + b"moov" + moov_body
-        f.write(moov_box)
-        mov_end = f.tell()
-        mov_size = mov_end - mov_offset
-        print(f"  MOV  at offset {mov_offset} ({mov_size} bytes)")
-
-        # Final padding to round up
-        f.write(b"\x00" * 512 * 50)
-        total = f.tell()
-        print(f"  Total image size: {total} bytes ({total / 1024:.1f} KB)")
+        f.write(buf)
 
 
 def main():
@@ -133,6 +140,8 @@ def main():
     test_mmap_reader()
     test_empty_block_skipping()
     test_sector_alignment()
+    test_header_search()
+    test_ooxml_type_matching()
     test_trim_detection()
     test_file_carving()
 
@@ -195,6 +204,22 @@ def test_empty_block_skipping():
     # Empty bytes → edge case
     assert is_empty_block(b"") is True
 
+    # Blocks longer than the cached zero buffer (block + overlap), on both
+    # the NumPy and the memcmp path; the buffer must not grow to fit them
+    import recovery.mmap_reader as mmap_reader
+    long_zero = bytes(mmap_reader._ZERO_BUF_SIZE + 65536)
+    long_dirty = bytearray(long_zero)
+    long_dirty[mmap_reader._ZERO_BUF_SIZE + 1] = 1     # between the samples
+    has_numpy = mmap_reader._HAS_NUMPY
+    try:
+        for use_numpy in (has_numpy, False):
+            mmap_reader._HAS_NUMPY = use_numpy
+            assert is_empty_block(long_zero) is True
+            assert is_empty_block(bytes(long_dirty)) is False
+    finally:
+        mmap_reader._HAS_NUMPY = has_numpy
+    assert len(mmap_reader._zero_buf) == mmap_reader._ZERO_BUF_SIZE
+
     # Test with mmap reader skipping
     tmpdir = tempfile.mkdtemp(prefix="test_skip_")
     try:
@@ -241,6 +266,119 @@ def test_sector_alignment():
     print("  ✅ sector alignment: PASS")
 
 
+def _find_each_header(data):
+    """Reference result: one bytes.find() loop per header."""
+    hits = {}
+    for header, _ in HEADER_SIGNATURES:
+        positions, pos = [], data.find(header)
+        while pos != -1:
+            positions.append(pos)
+            pos = data.find(header, pos + 1)
+        if positions:
+            hits[header] = positions
+    return hits
+
+
+def test_header_search():
+    """Single-pass header search matches per-header find(), zero-heavy data included."""
+    print("── Test: header search ──")
+
+    rng = random.Random(7)
+    size = 4 * 1024 * 1024
+    nearly_empty = bytearray(size)
+    for _ in range(64):
+        nearly_empty[rng.randrange(size)] = rng.randrange(256)
+    half_zero = b"".join(
+        bytes(512) if rng.random() < 0.5 else rng.randbytes(512)
+        for _ in range(size // 512)
+    )
+    with_headers = bytearray(rng.randbytes(size))
+    for header, _ in HEADER_SIGNATURES:
+        pos = rng.randrange(size - len(header))
+        with_headers[pos:pos + len(header)] = header
+
+    # Check the NumPy pair table and the per-header fallback both
+    import recovery.signatures as signatures
+    has_numpy = signatures._HAS_NUMPY
+    if not has_numpy:
+        print("  (numpy not installed — checking the fallback only)")
+    try:
+        for name, data in (("nearly empty", bytes(nearly_empty)),
+                           ("half zero", half_zero),
+                           ("random + headers", bytes(with_headers))):
+            expected = _find_each_header(data)
+            for use_numpy in (has_numpy, False):
+                signatures._HAS_NUMPY = use_numpy
+                hits = find_all_headers(data)
+                assert hits == expected, (
+                    f"{name}: header hits differ from find() (numpy={use_numpy})"
+                )
+            print(f"  {name}: {sum(map(len, expected.values()))} hits")
+    finally:
+        signatures._HAS_NUMPY = has_numpy
+
+    print("  ✅ header search: PASS")
+
+
+def _build_ooxml(part_dir, content_types_first=True):
+    """A minimal OOXML-shaped ZIP: small XML parts plus a large media part."""
+    rng = random.Random(part_dir)
+    names = ["_rels/.rels", part_dir + "document.xml", part_dir + "styles.xml",
+             "docProps/app.xml"]
+    if content_types_first:
+        names.insert(0, "[Content_Types].xml")   # Microsoft Office order
+    else:
+        names.append("[Content_Types].xml")      # LibreOffice order
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name in names:
+            zf.writestr(name, f'<Part Name="/{name}"/>'.encode() * 40)
+            if name.endswith("document.xml"):
+                zf.writestr(part_dir + "media/image1.png", rng.randbytes(20000))
+    return buf.getvalue()
+
+
+def test_ooxml_type_matching():
+    """docx/xlsx/pptx data must match its own extension and no other."""
+    print("── Test: OOXML type matching ──")
+
+    kinds = {"docx": "word/", "xlsx": "xl/", "pptx": "ppt/"}
+    for kind, part_dir in kinds.items():
+        for ct_first in (True, False):
+            data = _build_ooxml(part_dir, ct_first)
+            # Whole file, and the 4 KB head sample the savers validate
+            for sample in (data, data[:4096]):
+                for claimed in kinds:
+                    ok = validate_file_data_matches_extension(claimed, sample)
+                    assert ok == (claimed == kind), (
+                        f"{kind} data (ct_first={ct_first}, {len(sample)} bytes) "
+                        f"{'accepted' if ok else 'rejected'} as .{claimed}"
+                    )
+
+    # A complete package without [Content_Types].xml is just a ZIP
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("word/document.xml", b"<w:document/>")
+    assert not validate_file_data_matches_extension("docx", buf.getvalue())
+
+    # word/ parts outside both 64 KB search windows (a large thumbnail ahead
+    # of them, a central directory over 64 KB after) — unknown, so accepted
+    rng = random.Random(11)
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("[Content_Types].xml", b"<Types/>")
+        zf.writestr("docProps/thumbnail.jpeg", rng.randbytes(100_000))
+        zf.writestr("word/document.xml", b"<w:document/>")
+        for i in range(1500):
+            zf.writestr(f"customXml/item{i:04d}.xml", b"<x/>")
+    data = buf.getvalue()
+    window = 64 * 1024
+    assert b"word/" not in data[:window] and b"word/" not in data[-window:]
+    assert validate_file_data_matches_extension("docx", data)
+
+    print("  ✅ OOXML type matching: PASS")
+
+
 def test_trim_detection():
     """Test TRIM detection (basic — just verify it doesn't crash)."""
     print("── Test: TRIM detection ──")
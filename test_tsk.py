@@ -41,9 +41,6 @@ try:
     for entry in root:
         count += 1
         meta = entry.info.meta
-        name = entry.info.name.name
-        if isinstance(name, bytes):
-            name = name.decode("utf-8", errors="replace")
 
         if meta:
             is_del = bool(meta.flags & pytsk3.TSK_FS_META_FLAG_UNALLOC) or \
@@ -51,6 +48,10 @@ try:
             if is_del:
                 deleted += 1
                 if deleted <= 30:
+                    # Only decode the names we actually print
+                    name = entry.info.name.name
+                    if isinstance(name, bytes):
+                        name = name.decode("utf-8", errors="replace")
                     ext = name.rsplit(".", 1)[-1].lower() if "." in name else ""
                     print(f"  DELETED: {name}  size={meta.size}  ext={ext}")
 
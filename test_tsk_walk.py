@@ -0,0 +1,321 @@
+"""
+Test the TSK directory walk against a synthetic FAT16 image.
+
+The threaded walk (TSK_WORKERS > 1) is opt-in; this checks it finds
+exactly what the single-threaded walk finds — same deleted files, same
+inodes visited, same entry / directory counts — that the visited-inode
+bitmap stays small on a large, mostly empty FAT32 volume, and that the
+streaming scan stops its worker on close() and timeout.  Needs pytsk3.
+"""
+import os
+import random
+import shutil
+import struct
+import tempfile
+import threading
+
+from recovery import tsk_scanner
+from recovery.tsk_scanner import is_available as tsk_is_available
+
+# ── FAT16 geometry: 16 MiB, 2 KiB clusters ──
+_SECTOR = 512
+_SPC = 4                                  # sectors per cluster
+_CLUSTER = _SECTOR * _SPC
+_TOTAL_SECTORS = 32768
+_FAT_SECTORS = 32
+_ROOT_ENTRIES = 512
+_DATA_START = 1 + 2 * _FAT_SECTORS + _ROOT_ENTRIES * 32 // _SECTOR
+_FAT_DATE = ((2020 - 1980) << 9) | (1 << 5) | 1   # 2020-01-01
+
+
+def _dirent(name: str, attr: int, cluster: int, size: int, deleted=False) -> bytes:
+    """One 32-byte FAT directory entry for an 8.3 *name*."""
+    base, _, ext = name.partition(".")
+    raw = base.upper().ljust(8)[:8].encode() + ext.upper().ljust(3)[:3].encode()
+    if name in (".", ".."):
+        raw = name.ljust(11).encode()
+    if deleted:
+        raw = b"\xE5" + raw[1:]
+    return raw + struct.pack(
+        "<BBBHHHHHHHI", attr, 0, 0, 0, _FAT_DATE, _FAT_DATE, 0,
+        0, _FAT_DATE, cluster, size,
+    )
+
+
+def build_fat16_image(path: str) -> int:
+    """
+    Write a FAT16 image with nested live and deleted directories holding
+    live and deleted .jpg files.  Returns the number of deleted .jpg files
+    a complete walk must find.
+    """
+    rng = random.Random(1234)
+    image = bytearray(_TOTAL_SECTORS * _SECTOR)
+    fat = [0] * (_FAT_SECTORS * _SECTOR // 2)
+    fat[0], fat[1] = 0xFFF8, 0xFFFF
+    next_cluster = [2]
+    expected = [0]
+
+    def alloc(n: int, allocated: bool) -> int:
+        first = next_cluster[0]
+        next_cluster[0] += n
+        if allocated:
+            for c in range(first, first + n - 1):
+                fat[c] = c + 1
+            fat[first + n - 1] = 0xFFFF
+        return first
+
+    def cluster_offset(c: int) -> int:
+        return (_DATA_START + (c - 2) * _SPC) * _SECTOR
+
+    def make_dir(depth: int, parent: int, deleted: bool) -> int:
+        """Build one directory cluster (and its children); returns its cluster."""
+        me = alloc(1, not deleted)
+        entries = [_dirent(".", 0x10, me, 0), _dirent("..", 0x10, parent, 0)]
+        entries += make_children(depth, me, deleted)
+        image[cluster_offset(me):cluster_offset(me) + 32 * len(entries)] = b"".join(entries)
+        return me
+
+    def make_children(depth: int, me: int, in_deleted_dir: bool) -> list[bytes]:
+        entries = []
+        for i in range(rng.randint(3, 6)):
+            size = rng.randint(1500, 5000)
+            deleted = in_deleted_dir or rng.random() < 0.5
+            ext = "jpg" if rng.random() < 0.8 else "txt"
+            first = alloc(-(-size // _CLUSTER), not deleted)
+            off = cluster_offset(first)
+            image[off:off + size] = rng.randbytes(size)
+            entries.append(_dirent(f"F{depth}{me:04X}{i}.{ext}", 0x20, first, size, deleted))
+            if deleted and ext == "jpg":
+                expected[0] += 1
+        if depth < 3:
+            for i in range(rng.randint(2, 3)):
+                deleted = in_deleted_dir or (depth > 0 and i == 0)
+                sub = make_dir(depth + 1, me, deleted)
+                entries.append(_dirent(f"D{depth}{sub:05X}", 0x10, sub, 0, deleted))
+        return entries
+
+    root = make_children(0, 0, False)
+    assert len(root) <= _ROOT_ENTRIES
+    assert next_cluster[0] < (_TOTAL_SECTORS - _DATA_START) // _SPC
+
+    boot = bytearray(_SECTOR)
+    boot[0:3] = b"\xEB\x3C\x90"
+    boot[3:11] = b"MSDOS5.0"
+    struct.pack_into("<HBHBHHBHHHI", boot, 11, _SECTOR, _SPC, 1, 2, _ROOT_ENTRIES,
+                     _TOTAL_SECTORS, 0xF8, _FAT_SECTORS, 32, 64, 0)
+    struct.pack_into("<IBBBI", boot, 32, 0, 0x80, 0, 0x29, 0x1234ABCD)
+    boot[43:54] = b"TSKWALK    "
+    boot[54:62] = b"FAT16   "
+    boot[510:512] = b"\x55\xAA"
+    image[0:_SECTOR] = boot
+
+    fat_bytes = struct.pack(f"<{len(fat)}H", *fat)
+    for copy in range(2):
+        start = (1 + copy * _FAT_SECTORS) * _SECTOR
+        image[start:start + len(fat_bytes)] = fat_bytes
+    root_start = (1 + 2 * _FAT_SECTORS) * _SECTOR
+    image[root_start:root_start + 32 * len(root)] = b"".join(root)
+
+    with open(path, "wb") as f:
+        f.write(image)
+    return expected[0]
+
+
+def _walk(img_path: str, workers: int):
+    """Run the directory walk with *workers* threads; returns what it saw."""
+    import pytsk3
+
+    fs_info = pytsk3.FS_Info(pytsk3.Img_Info(img_path))
+    visited = tsk_scanner._InodeBitmap()
+    results = []
+    found = set()
+    stats = tsk_scanner._ScanStats()
+    tsk_scanner._traverse_directory(
+        fs_info, fs_info.open_dir("/"), "/", img_path,
+        tsk_scanner._wanted_exts_for(frozenset({"Image"})),
+        results, None, None, visited, found, threading.Event(), stats,
+        workers=workers,
+    )
+    inodes = {f.inode for f in results}
+    assert found == inodes, "found_inodes out of step with the reported files"
+    return inodes, visited.blocks, stats.entries, stats.dirs
+
+
+def test_threaded_walk_matches_sequential():
+    """The opt-in threaded walk must see exactly what the sequential walk sees."""
+    print("── Test: threaded TSK walk ──")
+    if not tsk_is_available():
+        print("  ⏭  pytsk3 not installed — skipped")
+        return
+
+    tmpdir = tempfile.mkdtemp(prefix="tsk_walk_")
+    try:
+        img_path = os.path.join(tmpdir, "fat16.img")
+        expected = build_fat16_image(img_path)
+
+        inodes, visited, entries, dirs = _walk(img_path, workers=1)
+        print(f"  sequential: {len(inodes)} deleted files, {entries} entries, {dirs} dirs")
+        assert len(inodes) == expected, f"expected {expected} deleted files, got {len(inodes)}"
+
+        for workers in (2, 4, 8):
+            for _ in range(3):   # thread interleaving varies run to run
+                t_inodes, t_visited, t_entries, t_dirs = _walk(img_path, workers)
+                assert t_inodes == inodes, f"{workers} workers: deleted-file inodes differ"
+                assert t_visited == visited, f"{workers} workers: visited inodes differ"
+                assert (t_entries, t_dirs) == (entries, dirs), (
+                    f"{workers} workers: {t_entries} entries / {t_dirs} dirs, "
+                    f"expected {entries} / {dirs}"
+                )
+
+        print("  ✅ threaded TSK walk: PASS")
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def build_sparse_fat32_image(path: str, size: int) -> int:
+    """
+    Write a *size*-byte FAT32 image as a sparse file: boot sector, FSInfo,
+    the first FAT entries and a root directory holding one deleted .jpg.
+    Everything else stays a hole.  Returns TSK's last_inum for the volume.
+    """
+    spc = 64                                          # 32 KiB clusters
+    reserved = 32
+    total = size // _SECTOR
+    clusters = total // spc
+    fat_sectors = -(-(clusters + 2) * 4 // _SECTOR)
+    data_start = reserved + 2 * fat_sectors
+
+    boot = bytearray(_SECTOR)
+    boot[0:3] = b"\xEB\x58\x90"
+    boot[3:11] = b"MSDOS5.0"
+    struct.pack_into("<HBHBHHBHHHII", boot, 11, _SECTOR, spc, reserved, 2, 0, 0,
+                     0xF8, 0, 63, 255, 0, total)
+    struct.pack_into("<IHHIHH", boot, 36, fat_sectors, 0, 0, 2, 1, 6)
+    struct.pack_into("<BBBI", boot, 64, 0x80, 0, 0x29, 0x1234ABCD)
+    boot[71:82] = b"TSKSPARSE  "
+    boot[82:90] = b"FAT32   "
+    boot[510:512] = b"\x55\xAA"
+
+    fsinfo = bytearray(_SECTOR)
+    struct.pack_into("<I", fsinfo, 0, 0x41615252)
+    struct.pack_into("<III", fsinfo, 484, 0x61417272, 0xFFFFFFFF, 3)
+    fsinfo[510:512] = b"\x55\xAA"
+
+    # Cluster 2 is the root directory, clusters 3-4 the deleted file's data
+    fat_head = struct.pack("<5I", 0x0FFFFFF8, 0x0FFFFFFF, 0x0FFFFFFF, 0, 0)
+    root = (_dirent("TSKSPARSE", 0x08, 0, 0)
+            + _dirent("GONE.jpg", 0x20, 3, 40000, deleted=True))
+
+    def cluster_offset(c: int) -> int:
+        return (data_start + (c - 2) * spc) * _SECTOR
+
+    with open(path, "wb") as f:
+        f.truncate(size)
+        for offset, blob in (
+            (0, boot), (_SECTOR, fsinfo), (6 * _SECTOR, boot),
+            (reserved * _SECTOR, fat_head),
+            ((reserved + fat_sectors) * _SECTOR, fat_head),
+            (cluster_offset(2), root),
+            (cluster_offset(3), b"\xFF\xD8\xFF\xE0" + bytes(40000 - 4)),
+        ):
+            f.seek(offset)
+            f.write(blob)
+    # TSK numbers FAT inodes by 32-byte directory-entry slot in the data area
+    return (total - data_start) * (_SECTOR // 32)
+
+
+def test_sparse_fat_visited_memory():
+    """A huge FAT volume must not cost memory in proportion to last_inum."""
+    import tracemalloc
+
+    print("── Test: visited-inode memory on a large sparse FAT32 ──")
+    if not tsk_is_available():
+        print("  ⏭  pytsk3 not installed — skipped")
+        return
+
+    tmpdir = tempfile.mkdtemp(prefix="tsk_sparse_")
+    try:
+        img_path = os.path.join(tmpdir, "fat32.img")
+        slots = build_sparse_fat32_image(img_path, 8 << 30)
+        results = []
+        tracemalloc.start()
+        try:
+            tsk_scanner._do_tsk_scan(
+                img_path, True, True, results, None, None,
+                threading.Event(), {"Image"},
+            )
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        print(f"  ~{slots:,} inode slots, peak {peak / 1024:.0f} KiB, "
+              f"{len(results)} deleted files")
+        # FAT overwrites a deleted name's first byte, so match on the rest
+        assert [f.name[1:] for f in results] == ["ONE.JPG"], results
+        # A flat bitmap over every slot would be slots / 8 bytes (~32 MiB)
+        assert peak < 4 * 1024 * 1024, f"peak {peak:,} bytes"
+        print("  ✅ sparse FAT32 visited-inode memory: PASS")
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def _new_threads(before: set) -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t not in before]
+
+
+def test_scan_iter_streams_and_cancels():
+    """scan_deleted_files_iter: full run, early close() and timeout all stop the worker."""
+    print("── Test: streaming TSK scan ──")
+    if not tsk_is_available():
+        print("  ⏭  pytsk3 not installed — skipped")
+        return
+
+    tmpdir = tempfile.mkdtemp(prefix="tsk_iter_")
+    backlog = tsk_scanner._STREAM_BACKLOG
+    try:
+        img_path = os.path.join(tmpdir, "fat16.img")
+        expected = build_fat16_image(img_path)
+
+        streamed = list(tsk_scanner.scan_deleted_files_iter(img_path, categories={"Image"}))
+        collected = tsk_scanner.scan_deleted_files(img_path, categories={"Image"})
+        assert len(streamed) == expected, f"expected {expected}, streamed {len(streamed)}"
+        assert [f.inode for f in collected] == [f.inode for f in streamed]
+
+        # A one-slot queue keeps the worker blocked on the consumer
+        tsk_scanner._STREAM_BACKLOG = 1
+        before = set(threading.enumerate())
+        gen = tsk_scanner.scan_deleted_files_iter(img_path, categories={"Image"})
+        first = next(gen)
+        gen.close()
+        for t in _new_threads(before):
+            t.join(5)
+        assert first.inode == streamed[0].inode
+        assert not any(t.is_alive() for t in _new_threads(before)), "worker still running after close()"
+        print("  early close(): worker stopped")
+
+        statuses = []
+        before = set(threading.enumerate())
+        partial = list(tsk_scanner.scan_deleted_files_iter(
+            img_path, categories={"Image"}, timeout=0, on_status=statuses.append,
+        ))
+        for t in _new_threads(before):
+            t.join(5)
+        assert len(partial) <= expected
+        assert any("Timed out" in msg for msg in statuses), statuses
+        assert not any(t.is_alive() for t in _new_threads(before)), "worker still running after timeout"
+        print(f"  timeout: {len(partial)} files before cancel, worker stopped")
+
+        print("  ✅ streaming TSK scan: PASS")
+    finally:
+        tsk_scanner._STREAM_BACKLOG = backlog
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def main():
+    test_threaded_walk_matches_sequential()
+    test_sparse_fat_visited_memory()
+    test_scan_iter_streams_and_cancels()
+
+
+if __name__ == "__main__":
+    main()